@@ -0,0 +1,34 @@
+# Copyright 2019 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def snippets():
+    # Importing snippets pulls in google.cloud.tasks, grpc, and proto;
+    # defer that to the worker that actually runs these tests instead of
+    # paying it during collection.
+    import snippets as snippets_module
+
+    return snippets_module
+
+
+@pytest.fixture(scope="session")
+def tasks_client():
+    from google.cloud import tasks
+
+    # One client (and one underlying gRPC channel) for the whole test
+    # session; all RPCs are multiplexed over it.
+    return tasks.CloudTasksClient()
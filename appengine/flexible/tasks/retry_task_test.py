@@ -0,0 +1,57 @@
+# Copyright 2019 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import os
+import uuid
+
+import pytest
+
+TEST_PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT")
+TEST_LOCATION = os.getenv("TEST_QUEUE_LOCATION", "us-central1")
+
+
+@pytest.fixture(scope="module")
+def retry_queue_names(snippets, tasks_client):
+    names = [f"queue-{uuid.uuid4()}" for _ in range(3)]
+
+    yield names
+
+    def delete(queue_name):
+        try:
+            snippets.delete_queue(
+                TEST_PROJECT_ID, TEST_LOCATION, queue_name, client=tasks_client
+            )
+        except Exception as e:
+            print(f"Tried my best to clean up, but could not: {e}")
+
+    # The deletions are independent; fan them out so teardown costs one
+    # round-trip instead of three.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(names)) as executor:
+        list(executor.map(delete, names))
+
+
+def test_retry_task(snippets, retry_queue_names, tasks_client):
+    name = tasks_client.queue_path(
+        TEST_PROJECT_ID, TEST_LOCATION, retry_queue_names[2]
+    )
+    result = snippets.retry_task(
+        TEST_PROJECT_ID,
+        TEST_LOCATION,
+        retry_queue_names[0],
+        retry_queue_names[1],
+        retry_queue_names[2],
+        client=tasks_client,
+    )
+    assert name in result.name
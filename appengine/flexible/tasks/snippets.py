@@ -12,12 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import functools
+
 from google.cloud import tasks
 
 
-def create_queue(project, location, queue_blue_name, queue_red_name):
+@functools.lru_cache(maxsize=None)
+def _default_client():
+    # Creating a client is expensive (credential resolution plus a new gRPC
+    # channel), so share one across all snippet calls in this process.
+    return tasks.CloudTasksClient()
+
+
+def create_queue(project, location, queue_blue_name, queue_red_name, client=None):
     # [START cloud_tasks_taskqueues_using_yaml]
-    client = tasks.CloudTasksClient()
+    if client is None:
+        client = _default_client()
 
     # TODO(developer): Uncomment these lines and replace with your values.
     # project = 'my-project-id'
@@ -46,9 +57,10 @@ def create_queue(project, location, queue_blue_name, queue_red_name):
     return response
 
 
-def update_queue(project, location, queue):
+def update_queue(project, location, queue, client=None):
     # [START cloud_tasks_taskqueues_processing_rate]
-    client = tasks.CloudTasksClient()
+    if client is None:
+        client = _default_client()
 
     # TODO(developer): Uncomment these lines and replace with your values.
     # project = 'my-project-id'
@@ -69,9 +81,10 @@ def update_queue(project, location, queue):
     return response
 
 
-def create_task(project, location, queue):
+def create_task(project, location, queue, client=None):
     # [START cloud_tasks_taskqueues_new_task]
-    client = tasks.CloudTasksClient()
+    if client is None:
+        client = _default_client()
 
     # TODO(developer): Uncomment these lines and replace with your values.
     # project = 'my-project-id'
@@ -97,11 +110,12 @@ def create_task(project, location, queue):
     return response
 
 
-def create_tasks_with_data(project, location, queue):
+def create_tasks_with_data(project, location, queue, client=None):
     # [START cloud_tasks_taskqueues_passing_data]
     import json
 
-    client = tasks.CloudTasksClient()
+    if client is None:
+        client = _default_client()
 
     # TODO(developer): Uncomment these lines and replace with your values.
     # project = 'my-project-id'
@@ -136,9 +150,10 @@ def create_tasks_with_data(project, location, queue):
     return response
 
 
-def create_task_with_name(project, location, queue, task_name):
+def create_task_with_name(project, location, queue, task_name, client=None):
     # [START cloud_tasks_taskqueues_naming_tasks]
-    client = tasks.CloudTasksClient()
+    if client is None:
+        client = _default_client()
 
     # TODO(developer): Uncomment these lines and replace with your values.
     # project = 'my-project-id'
@@ -161,9 +176,10 @@ def create_task_with_name(project, location, queue, task_name):
     return response
 
 
-def delete_task(project, location, queue):
+def delete_task(project, location, queue, client=None):
     # [START cloud_tasks_taskqueues_deleting_tasks]
-    client = tasks.CloudTasksClient()
+    if client is None:
+        client = _default_client()
 
     # TODO(developer): Uncomment these lines and replace with your values.
     # project = 'my-project-id'
@@ -176,9 +192,10 @@ def delete_task(project, location, queue):
     return response
 
 
-def purge_queue(project, location, queue):
+def purge_queue(project, location, queue, client=None):
     # [START cloud_tasks_taskqueues_purging_tasks]
-    client = tasks.CloudTasksClient()
+    if client is None:
+        client = _default_client()
 
     # TODO(developer): Uncomment these lines and replace with your values.
     # project = 'my-project-id'
@@ -191,9 +208,10 @@ def purge_queue(project, location, queue):
     return response
 
 
-def pause_queue(project, location, queue):
+def pause_queue(project, location, queue, client=None):
     # [START cloud_tasks_taskqueues_pause_queue]
-    client = tasks.CloudTasksClient()
+    if client is None:
+        client = _default_client()
 
     # TODO(developer): Uncomment these lines and replace with your values.
     # project = 'my-project-id'
@@ -206,9 +224,10 @@ def pause_queue(project, location, queue):
     return response
 
 
-def delete_queue(project, location, queue):
+def delete_queue(project, location, queue, client=None):
     # [START cloud_tasks_taskqueues_deleting_queues]
-    client = tasks.CloudTasksClient()
+    if client is None:
+        client = _default_client()
 
     # TODO(developer): Uncomment these lines and replace with your values.
     # project = 'my-project-id'
@@ -221,11 +240,12 @@ def delete_queue(project, location, queue):
     return response
 
 
-def retry_task(project, location, fooqueue, barqueue, bazqueue):
+def retry_task(project, location, fooqueue, barqueue, bazqueue, client=None):
     # [START cloud_tasks_taskqueues_retrying_tasks]
     from google.protobuf import duration_pb2
 
-    client = tasks.CloudTasksClient()
+    if client is None:
+        client = _default_client()
 
     # TODO(developer): Uncomment these lines and replace with your values.
     # project = 'my-project-id'
@@ -270,3 +290,40 @@ def retry_task(project, location, fooqueue, barqueue, bazqueue):
         print(response)
     # [END cloud_tasks_taskqueues_retrying_tasks]
     return response
+
+
+async def create_tasks_bulk_async(
+    project, location, queue, payloads, max_concurrency=100
+):
+    """Create one task per payload, with up to max_concurrency in flight.
+
+    Cloud Tasks has no batch-create API, so bulk enqueueing is bounded by
+    round-trips; fanning the create_task calls out over the async client
+    turns N round-trips of latency into roughly N / max_concurrency.
+    """
+    client = tasks.CloudTasksAsyncClient()
+    parent = client.queue_path(project, location, queue)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def create(payload):
+        if not isinstance(payload, bytes):
+            payload = str(payload).encode()
+        task = {
+            "app_engine_http_request": {
+                "http_method": tasks.HttpMethod.POST,
+                "relative_uri": "/update_counter",
+                "app_engine_routing": {"service": "worker"},
+                "body": payload,
+            }
+        }
+        async with semaphore:
+            return await client.create_task(parent=parent, task=task)
+
+    return await asyncio.gather(*(create(payload) for payload in payloads))
+
+
+def create_tasks_bulk(project, location, queue, payloads, max_concurrency=100):
+    """Synchronous wrapper around create_tasks_bulk_async."""
+    return asyncio.run(
+        create_tasks_bulk_async(project, location, queue, payloads, max_concurrency)
+    )
@@ -12,119 +12,115 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import os
 import uuid
 
 import pytest
 
-import snippets
-
 TEST_PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT")
 TEST_LOCATION = os.getenv("TEST_QUEUE_LOCATION", "us-central1")
-QUEUE_NAME_1 = f"queue-{uuid.uuid4()}"
-QUEUE_NAME_2 = f"queue-{uuid.uuid4()}"
 
 
-@pytest.mark.order1
-def test_create_queue():
-    name = "projects/{}/locations/{}/queues/{}".format(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_2
-    )
+@pytest.fixture(scope="module")
+def queue_names():
+    # Generate the names inside a fixture rather than at import time, so
+    # collection stays cheap and each xdist worker that runs this file gets
+    # its own queue names.
+    return f"queue-{uuid.uuid4()}", f"queue-{uuid.uuid4()}"
+
+
+@pytest.fixture(scope="module")
+def test_queues(snippets, tasks_client, queue_names):
+    # Create both queues up front so the tests below can run in file order
+    # without explicit ordering markers.
+    queue_name_1, queue_name_2 = queue_names
     result = snippets.create_queue(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1, QUEUE_NAME_2
+        TEST_PROJECT_ID, TEST_LOCATION, queue_name_1, queue_name_2, client=tasks_client
     )
-    assert name in result.name
 
+    yield result
+
+    def delete(queue_name):
+        try:
+            snippets.delete_queue(
+                TEST_PROJECT_ID, TEST_LOCATION, queue_name, client=tasks_client
+            )
+        except Exception as e:
+            print(f"Tried my best to clean up, but could not: {e}")
 
-@pytest.mark.order2
-def test_update_queue():
-    name = "projects/{}/locations/{}/queues/{}".format(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1
+    # Both deletions are independent; run them concurrently.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(delete, queue_names))
+
+
+def test_create_queue(test_queues, tasks_client, queue_names):
+    name = tasks_client.queue_path(TEST_PROJECT_ID, TEST_LOCATION, queue_names[1])
+    assert name in test_queues.name
+
+
+def test_update_queue(snippets, test_queues, tasks_client, queue_names):
+    name = tasks_client.queue_path(TEST_PROJECT_ID, TEST_LOCATION, queue_names[0])
+    result = snippets.update_queue(
+        TEST_PROJECT_ID, TEST_LOCATION, queue_names[0], client=tasks_client
     )
-    result = snippets.update_queue(TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1)
     assert name in result.name
 
 
-@pytest.mark.order3
-def test_create_task():
-    name = "projects/{}/locations/{}/queues/{}".format(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1
+def test_create_task(snippets, test_queues, tasks_client, queue_names):
+    name = tasks_client.queue_path(TEST_PROJECT_ID, TEST_LOCATION, queue_names[0])
+    result = snippets.create_task(
+        TEST_PROJECT_ID, TEST_LOCATION, queue_names[0], client=tasks_client
     )
-    result = snippets.create_task(TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1)
     assert name in result.name
 
 
-@pytest.mark.order4
-def test_create_task_with_data():
-    name = "projects/{}/locations/{}/queues/{}".format(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1
-    )
+def test_create_task_with_data(snippets, test_queues, tasks_client, queue_names):
+    name = tasks_client.queue_path(TEST_PROJECT_ID, TEST_LOCATION, queue_names[0])
     result = snippets.create_tasks_with_data(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1
+        TEST_PROJECT_ID, TEST_LOCATION, queue_names[0], client=tasks_client
     )
     assert name in result.name
 
 
-@pytest.mark.order5
-def test_create_task_with_name():
-    name = "projects/{}/locations/{}/queues/{}".format(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1
-    )
+def test_create_task_with_name(snippets, test_queues, tasks_client, queue_names):
+    name = tasks_client.queue_path(TEST_PROJECT_ID, TEST_LOCATION, queue_names[0])
     result = snippets.create_task_with_name(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1, "foo"
+        TEST_PROJECT_ID, TEST_LOCATION, queue_names[0], "foo", client=tasks_client
     )
     assert name in result.name
 
 
-@pytest.mark.order6
-def test_delete_task():
-    result = snippets.delete_task(TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1)
+def test_delete_task(snippets, test_queues, tasks_client, queue_names):
+    result = snippets.delete_task(
+        TEST_PROJECT_ID, TEST_LOCATION, queue_names[0], client=tasks_client
+    )
     assert result is None
 
 
-@pytest.mark.order7
-def test_purge_queue():
-    name = "projects/{}/locations/{}/queues/{}".format(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1
+def test_purge_queue(snippets, test_queues, tasks_client, queue_names):
+    name = tasks_client.queue_path(TEST_PROJECT_ID, TEST_LOCATION, queue_names[0])
+    result = snippets.purge_queue(
+        TEST_PROJECT_ID, TEST_LOCATION, queue_names[0], client=tasks_client
     )
-    result = snippets.purge_queue(TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1)
     assert name in result.name
 
 
-@pytest.mark.order8
-def test_pause_queue():
-    name = "projects/{}/locations/{}/queues/{}".format(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1
+def test_pause_queue(snippets, test_queues, tasks_client, queue_names):
+    name = tasks_client.queue_path(TEST_PROJECT_ID, TEST_LOCATION, queue_names[0])
+    result = snippets.pause_queue(
+        TEST_PROJECT_ID, TEST_LOCATION, queue_names[0], client=tasks_client
     )
-    result = snippets.pause_queue(TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1)
     assert name in result.name
 
 
-@pytest.mark.order9
-def test_delete_queue():
-    result = snippets.delete_queue(TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_1)
-    assert result is None
-
-    result = snippets.delete_queue(TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME_2)
+def test_delete_queue(snippets, test_queues, tasks_client, queue_names):
+    result = snippets.delete_queue(
+        TEST_PROJECT_ID, TEST_LOCATION, queue_names[0], client=tasks_client
+    )
     assert result is None
 
-
-@pytest.mark.order10
-def test_retry_task():
-    QUEUE_SIZE = 3
-    QUEUE_NAME = []
-    for i in range(QUEUE_SIZE):
-        QUEUE_NAME.append(f"queue-{uuid.uuid4()}")
-
-    name = "projects/{}/locations/{}/queues/{}".format(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME[2]
-    )
-    result = snippets.retry_task(
-        TEST_PROJECT_ID, TEST_LOCATION, QUEUE_NAME[0], QUEUE_NAME[1], QUEUE_NAME[2]
+    result = snippets.delete_queue(
+        TEST_PROJECT_ID, TEST_LOCATION, queue_names[1], client=tasks_client
     )
-    assert name in result.name
-
-    for i in range(QUEUE_SIZE):
-        snippets.delete_queue(
-            project=TEST_PROJECT_ID, location=TEST_LOCATION, queue=QUEUE_NAME[i]
-        )
+    assert result is None
@@ -27,6 +27,8 @@ class UserPhoto(ndb.Model):
 
 class UploadFormHandler:
     def __call__(self, environ, start_response):
+        # Upload URLs are single-use: one upload consumes the URL, so
+        # each page view needs a fresh one.
         upload_url = blobstore.create_upload_url("/upload_photo")
 
         response = """
@@ -61,6 +63,8 @@ class UploadPhotoHandler(blobstore.BlobstoreUploadHandler):
 
 class ViewPhotoHandler(blobstore.BlobstoreDownloadHandler):
     def get_photo(self, environ, photo_key):
+        # send_blob only builds the serving header and never resolves the
+        # blob, so this lookup is the one existence check before replying.
         if not blobstore.get(photo_key):
             return "Photo key not found", http.HTTPStatus.NOT_FOUND, []
         else:
@@ -85,8 +89,29 @@ urls = [
 
 
 class Application:
+    # Characters that mean a pattern needs the regex engine.
+    _REGEX_CHARS = set("\\.^$*+?()[]{}|")
+
     def __init__(self, routes):
-        self.routes = routes
+        # Routes without captures or wildcards are just fixed paths, so
+        # dispatch them through an O(1) dict. Only capturing routes keep the
+        # (precompiled) regex scan.
+        self.static = {}
+        self.regex_routes = []
+        for regex, handler in routes:
+            path = regex.lstrip("^").removesuffix("$")
+            optional_slash = path.endswith("/?")
+            if optional_slash:
+                path = path[:-2]
+            # The blobstore handler classes cache per-request state on the
+            # instance (e.g. get_uploads memoizes the parsed form), so each
+            # request must get a fresh instance; only the classes are cached.
+            if self._REGEX_CHARS.isdisjoint(path):
+                self.static[path] = handler
+                if optional_slash:
+                    self.static[path + "/"] = handler
+            else:
+                self.regex_routes.append((re.compile(regex), handler))
 
     def not_found(self, environ, start_response):
         start_response("404 Not Found", [("Content-Type", "text/plain")])
@@ -94,12 +119,15 @@ class Application:
 
     def __call__(self, environ, start_response):
         path = environ.get("PATH_INFO", "").lstrip("/")
-        for regex, handler in self.routes:
-            match = re.search(regex, path)
+        handler = self.static.get(path)
+        if handler is not None:
+            environ["app.url_args"] = ()
+            return handler()(environ, start_response)
+        for pattern, handler in self.regex_routes:
+            match = pattern.search(path)
             if match is not None:
                 environ["app.url_args"] = match.groups()
-                callback = handler()  # instantiate the handler class
-                return callback(environ, start_response)
+                return handler()(environ, start_response)
         return self.not_found(environ, start_response)
 
 
@@ -28,10 +28,30 @@ import argparse
 import base64
 import cv2
 import io
-import json
+
+# orjson encodes the nested instances payload several times faster than
+# the stdlib codec, which matters once batches of images are posted
+# back to back; fall back to the stdlib when it is not installed.
+try:
+    import orjson as json
+except ImportError:
+    import json
 
 import requests
 
+# A shared session keeps the TCP connection to the container alive, so
+# back-to-back predictions skip the handshake the module-level
+# requests.post pays on every call.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+)
+_SESSION.headers.update({"Content-Type": "application/json"})
+
+# gRPC channels multiplex requests, so one channel per server is enough;
+# created lazily and reused across calls.
+_GRPC_STUBS = {}
+
 
 def preprocess_image(image_file_path, max_width, max_height):
     """Preprocesses input images for AutoML Vision Edge models.
@@ -94,10 +114,66 @@ def container_predict(image_file_path, image_key, port_number=8501):
     # please change localhost to IP of other servers.
     url = "http://localhost:{}/v1/models/default:predict".format(port_number)
 
-    response = requests.post(url, data=json.dumps(instances))
-    print(response.json())
+    response = _SESSION.post(url, data=json.dumps(instances))
+    predictions = json.loads(response.content)
+    print(predictions)
     # [END automl_vision_edge_container_predict]
-    return response.json()
+    return predictions
+
+
+def _get_grpc_stub(port_number):
+    """Gets a PredictionService stub for the given port, creating it once.
+
+    The channel handles reconnects itself and multiplexes concurrent
+    requests, so repeated calls reuse one TCP connection instead of
+    paying a handshake per prediction.
+    """
+    import grpc
+    from tensorflow_serving.apis import prediction_service_pb2_grpc
+
+    if port_number not in _GRPC_STUBS:
+        channel = grpc.insecure_channel("localhost:{}".format(port_number))
+        _GRPC_STUBS[port_number] = prediction_service_pb2_grpc.PredictionServiceStub(
+            channel
+        )
+    return _GRPC_STUBS[port_number]
+
+
+def container_predict_grpc(image_file_path, image_key, port_number=8500):
+    """Sends a prediction request to TFServing docker container gRPC API.
+
+    The gRPC endpoint carries the image as a binary tensor, skipping the
+    JSON encoding and base64 expansion the REST endpoint needs, which
+    makes it the faster choice when the same caller predicts many images
+    back to back. Requires the tensorflow-serving-api package.
+
+    Args:
+        image_file_path: Path to a local image for the prediction request.
+        image_key: Your chosen string key to identify the given image.
+        port_number: The port number on your device to accept gRPC calls.
+    Returns:
+        The response of the prediction request.
+    """
+    import tensorflow as tf
+    from tensorflow_serving.apis import predict_pb2
+
+    encoded_image = preprocess_image(
+        image_file_path=image_file_path, max_width=640, max_height=480
+    )
+
+    request = predict_pb2.PredictRequest()
+    request.model_spec.name = "default"
+    # The REST API wraps the image in {'b64': ...}; over gRPC the raw
+    # bytes go straight into a string tensor.
+    request.inputs["image_bytes"].CopyFrom(
+        tf.make_tensor_proto([base64.b64decode(encoded_image)])
+    )
+    request.inputs["key"].CopyFrom(tf.make_tensor_proto([image_key]))
+
+    stub = _get_grpc_stub(port_number)
+    response = stub.Predict(request, 10.0)
+    print(response)
+    return response
 
 
 def main():
@@ -105,9 +181,17 @@ def main():
     parser.add_argument("--image_file_path", type=str)
     parser.add_argument("--image_key", type=str, default="1")
     parser.add_argument("--port_number", type=int, default=8501)
+    parser.add_argument(
+        "--use_grpc",
+        action="store_true",
+        help="Call the container's gRPC endpoint instead of REST.",
+    )
     args = parser.parse_args()
 
-    container_predict(args.image_file_path, args.image_key, args.port_number)
+    if args.use_grpc:
+        container_predict_grpc(args.image_file_path, args.image_key, args.port_number)
+    else:
+        container_predict(args.image_file_path, args.image_key, args.port_number)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,36 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import google.auth
+
+# HTTP Queues are currently in public beta
+from google.cloud import tasks_v2beta3 as tasks
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def tasks_client():
+    # Share one client (and its gRPC channel) across the whole session
+    # instead of paying for credential resolution and a TLS handshake in
+    # every test.
+    return tasks.CloudTasksClient()
+
+
+@pytest.fixture(scope="session")
+def gcp_project():
+    # Resolving Application Default Credentials probes the environment, ADC
+    # files, and possibly the metadata server; do it once per session.
+    _, project = google.auth.default()
+    return project
@@ -14,8 +14,6 @@
 
 import uuid
 
-import google.auth
-
 # HTTP Queues are currently in public beta
 from google.cloud import tasks_v2beta3 as tasks
 
@@ -29,9 +27,9 @@ LOCATION = "us-central1"
 
 
 @pytest.fixture
-def q():
+def q(tasks_client, gcp_project):
     # Use the default project and a random name for the test queue
-    _, project = google.auth.default()
+    project = gcp_project
     name = "tests-tasks-" + uuid.uuid4().hex
 
     http_target = {
@@ -41,8 +39,8 @@ def q():
         }
     }
 
-    # Use the client to send a CreateQueueRequest.
-    client = tasks.CloudTasksClient()
+    # Use the shared client to send a CreateQueueRequest.
+    client = tasks_client
     queue = client.create_queue(
         tasks.CreateQueueRequest(
             parent=client.common_location_path(project, LOCATION),
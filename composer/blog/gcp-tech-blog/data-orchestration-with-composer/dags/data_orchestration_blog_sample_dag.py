@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+
 from airflow import models
 
 from airflow.hooks.base import BaseHook
@@ -35,6 +37,24 @@ DATASET = "{{var.value.bigquery_dataset}}"
 TABLE = "{{var.value.bigquery_table}}"
 
 
+@functools.lru_cache(maxsize=1)
+def _slack_webhook_token():
+    # Looking up the connection queries the Airflow metadata DB, so do it
+    # once per worker process rather than once per failed task.
+    return BaseHook.get_connection("slack_connection").password
+
+
+@functools.lru_cache(maxsize=1)
+def _slack_error_operator():
+    return SlackWebhookOperator(
+        task_id="post_slack_error",
+        http_conn_id="slack_connection",
+        channel="#airflow-alerts",
+        webhook_token=_slack_webhook_token(),
+        message="",
+    )
+
+
 # Slack error notification example taken from Kaxil Naik's blog on Slack Integration:
 # https://medium.com/datareply/integrating-slack-alerts-in-airflow-c9dcd155105
 def on_failure_callback(context):
@@ -46,14 +66,8 @@ def on_failure_callback(context):
             *Execution Time*: {context.get('execution_date')}
             *Log Url*: {ti.log_url}
             """
-    slack_webhook_token = BaseHook.get_connection("slack_connection").password
-    slack_error = SlackWebhookOperator(
-        task_id="post_slack_error",
-        http_conn_id="slack_connection",
-        channel="#airflow-alerts",
-        webhook_token=slack_webhook_token,
-        message=slack_msg,
-    )
+    slack_error = _slack_error_operator()
+    slack_error.message = slack_msg
     slack_error.execute(context)
 
 
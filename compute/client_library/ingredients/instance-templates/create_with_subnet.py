@@ -72,3 +72,65 @@ def create_template_with_subnet(
 
 
 # </INGREDIENT>
+
+
+# <INGREDIENT create_template_with_subnet_async>
+async def create_template_with_subnet_async(
+    project_id: str, network: str, subnetwork: str, template_name: str
+) -> compute_v1.InstanceTemplate:
+    """
+    Create an instance template that uses a provided subnet, without blocking
+    the event loop while the operation runs.
+
+    Creating N templates with asyncio.gather() takes roughly as long as the
+    slowest single creation, since the Compute API processes the inserts
+    server-side in parallel.
+
+    Args:
+        project_id: project ID or project number of the Cloud project you use.
+        network: the network to be used in the new template. This value uses
+            the following format: "projects/{project}/global/networks/{network}"
+        subnetwork: the subnetwork to be used in the new template. This value
+            uses the following format: "projects/{project}/regions/{region}/subnetworks/{subnetwork}"
+        template_name: name of the new template to create.
+
+    Returns:
+        InstanceTemplate object that represents the new instance template.
+    """
+    disk = compute_v1.AttachedDisk()
+    initialize_params = compute_v1.AttachedDiskInitializeParams()
+    initialize_params.source_image = (
+        "projects/debian-cloud/global/images/family/debian-11"
+    )
+    initialize_params.disk_size_gb = 250
+    disk.initialize_params = initialize_params
+    disk.auto_delete = True
+    disk.boot = True
+
+    template = compute_v1.InstanceTemplate()
+    template.name = template_name
+    template.properties = compute_v1.InstanceProperties()
+    template.properties.disks = [disk]
+    template.properties.machine_type = "e2-standard-4"
+
+    network_interface = compute_v1.NetworkInterface()
+    network_interface.network = network
+    network_interface.subnetwork = subnetwork
+    template.properties.network_interfaces = [network_interface]
+
+    template_client = compute_v1.InstanceTemplatesClient()
+    # The insert and get RPCs block, so they run in worker threads to keep
+    # the event loop free for the other gathered coroutines.
+    operation = await asyncio.to_thread(
+        template_client.insert,
+        project=project_id,
+        instance_template_resource=template,
+    )
+    await wait_for_extended_operation_async(operation, "instance template creation")
+
+    return await asyncio.to_thread(
+        template_client.get, project=project_id, instance_template=template_name
+    )
+
+
+# </INGREDIENT>
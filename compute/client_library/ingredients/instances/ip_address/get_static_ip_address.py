@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 # flake8: noqa
+import functools
 from typing import Optional
 
 from google.cloud.compute_v1.types import Address
@@ -20,6 +21,18 @@ from google.cloud.compute_v1.services.global_addresses import GlobalAddressesCli
 
 
 # <INGREDIENT get_static_ip_address>
+@functools.lru_cache(maxsize=1)
+def _regional_addresses_client() -> AddressesClient:
+    # Client construction sets up a new channel and TLS state; share one
+    # client per process across calls.
+    return AddressesClient()
+
+
+@functools.lru_cache(maxsize=1)
+def _global_addresses_client() -> GlobalAddressesClient:
+    return GlobalAddressesClient()
+
+
 def get_static_ip_address(
     project_id: str, address_name: str, region: Optional[str] = None
 ) -> Address:
@@ -37,12 +50,12 @@ def get_static_ip_address(
     Address: The Address object containing details about the requested IP.
     """
     if region:
-        # Use regional client if a region is specified
-        client = AddressesClient()
+        # Use the shared regional client if a region is specified
+        client = _regional_addresses_client()
         address = client.get(project=project_id, region=region, address=address_name)
     else:
-        # Use global client if no region is specified
-        client = GlobalAddressesClient()
+        # Use the shared global client if no region is specified
+        client = _global_addresses_client()
         address = client.get(project=project_id, address=address_name)
 
     return address
@@ -18,6 +18,7 @@
 # flake8: noqa
 from __future__ import annotations
 
+import asyncio
 import sys
 from typing import Any
 
@@ -74,3 +75,66 @@ def wait_for_extended_operation(
 
 
 # </INGREDIENT>
+
+
+# <INGREDIENT wait_for_extended_operation_async>
+async def wait_for_extended_operation_async(
+    operation: ExtendedOperation, verbose_name: str = "operation", timeout: int = 300
+) -> Any:
+    """
+    Waits for the extended (long-running) operation to complete without
+    blocking the event loop, so several operations can be awaited at once
+    with asyncio.gather().
+
+    If the operation is successful, it will return its result.
+    If the operation ends with an error, an exception will be raised.
+    If there were any warnings during the execution of the operation
+    they will be printed to sys.stderr.
+
+    Args:
+        operation: a long-running operation you want to wait on.
+        verbose_name: (optional) a more verbose name of the operation,
+            used only during error and warning reporting.
+        timeout: how long (in seconds) to wait for operation to finish.
+
+    Returns:
+        Whatever the operation.result() returns.
+
+    Raises:
+        This method will raise the exception received from `operation.exception()`
+        or RuntimeError if there is no exception set, but there is an `error_code`
+        set for the `operation`.
+
+        In case of an operation taking longer than `timeout` seconds to complete,
+        a `TimeoutError` will be raised.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    # operation.done() refreshes the operation with a blocking poll RPC, so
+    # it runs in a worker thread; sleeping between polls yields the loop to
+    # other pending operations.
+    while not await asyncio.to_thread(operation.done):
+        if loop.time() >= deadline:
+            raise TimeoutError(f"Timed out waiting for {verbose_name}.")
+        await asyncio.sleep(1)
+
+    result = operation.result()
+
+    if operation.error_code:
+        print(
+            f"Error during {verbose_name}: [Code: {operation.error_code}]: {operation.error_message}",
+            file=sys.stderr,
+            flush=True,
+        )
+        print(f"Operation ID: {operation.name}", file=sys.stderr, flush=True)
+        raise operation.exception() or RuntimeError(operation.error_message)
+
+    if operation.warnings:
+        print(f"Warnings during {verbose_name}:\n", file=sys.stderr, flush=True)
+        for warning in operation.warnings:
+            print(f" - {warning.code}: {warning.message}", file=sys.stderr, flush=True)
+
+    return result
+
+
+# </INGREDIENT>
@@ -19,4 +19,8 @@
 # <INGREDIENT wait_for_extended_operation />
 
 # <INGREDIENT create_template_with_subnet />
+
+# <INGREDIENT wait_for_extended_operation_async />
+
+# <INGREDIENT create_template_with_subnet_async />
 # </REGION compute_template_create_with_subnet>
@@ -15,14 +15,15 @@ from __future__ import annotations
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
+import functools
 import itertools
 import json
 import logging
-import multiprocessing as mp
 import os
 import platform
 import re
 import subprocess
+import threading
 import time
 from typing import Any
 import uuid
@@ -30,9 +31,39 @@ import uuid
 from google.api_core import retry
 import pytest
 
+try:
+    # C-extension encoder, 2-5x faster than stdlib json and returns bytes
+    # directly, skipping the encode() round-trip on every publish.
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
 TIMEOUT_SEC = 30 * 60  # 30 minutes (in seconds)
 
 
+# Each Pub/Sub client opens its own gRPC channel, so share one of each kind
+# across fixtures and helpers. The import stays lazy to keep collection fast.
+@functools.lru_cache(maxsize=1)
+def pubsub_publisher_client():
+    from google.cloud import pubsub
+
+    return pubsub.PublisherClient()
+
+
+@functools.lru_cache(maxsize=1)
+def pubsub_subscriber_client():
+    from google.cloud import pubsub
+
+    return pubsub.SubscriberClient()
+
+
 @pytest.fixture(scope="session")
 def project() -> str:
     # This is set by the testing infrastructure.
@@ -98,9 +129,7 @@ def bucket_name(test_name: str, location: str, unique_id: str) -> Iterator[str]:
 def pubsub_topic(
     test_name: str, project: str, unique_id: str
 ) -> Iterator[Callable[[str], str]]:
-    from google.cloud import pubsub
-
-    publisher = pubsub.PublisherClient()
+    publisher = pubsub_publisher_client()
     created_topics = []
 
     def create_topic(name: str) -> str:
@@ -114,18 +143,21 @@ def pubsub_topic(
 
     yield create_topic
 
+    from google.api_core.exceptions import NotFound
+
     for topic_path in created_topics:
-        publisher.delete_topic(topic=topic_path)
-        print(f"pubsub_topic deleted: {topic_path}")
+        try:
+            publisher.delete_topic(topic=topic_path)
+            print(f"pubsub_topic deleted: {topic_path}")
+        except NotFound:
+            print(f"pubsub_topic already deleted: {topic_path}")
 
 
 @pytest.fixture(scope="session")
 def pubsub_subscription(
     test_name: str, project: str, unique_id: str
 ) -> Iterator[Callable[[str, str], str]]:
-    from google.cloud import pubsub
-
-    subscriber = pubsub.SubscriberClient()
+    subscriber = pubsub_subscriber_client()
     created_subscriptions = []
 
     def create_subscription(name: str, topic_path: str) -> str:
@@ -141,15 +173,18 @@ def pubsub_subscription(
 
     yield create_subscription
 
+    from google.api_core.exceptions import NotFound
+
     for subscription_path in created_subscriptions:
-        subscriber.delete_subscription(subscription=subscription_path)
-        print(f"pubsub_subscription deleted: {subscription_path}")
+        try:
+            subscriber.delete_subscription(subscription=subscription_path)
+            print(f"pubsub_subscription deleted: {subscription_path}")
+        except NotFound:
+            print(f"pubsub_subscription already deleted: {subscription_path}")
 
 
 def pubsub_publish(topic_path: str, messages: list[str]) -> None:
-    from google.cloud import pubsub
-
-    publisher = pubsub.PublisherClient()
+    publisher = pubsub_publisher_client()
     futures = [publisher.publish(topic_path, msg.encode("utf-8")) for msg in messages]
     _ = [future.result() for future in futures]  # wait synchronously
     print(f"pubsub_publish {len(messages)} message(s) to {topic_path}:")
@@ -424,9 +459,7 @@ class Utils:
 
     @staticmethod
     def pubsub_topic(name: str, project: str = PROJECT) -> str:
-        from google.cloud import pubsub
-
-        publisher_client = pubsub.PublisherClient()
+        publisher_client = pubsub_publisher_client()
         topic_path = publisher_client.topic_path(project, Utils.hyphen_name(name))
         topic = publisher_client.create_topic(request={"name": topic_path})
 
@@ -448,9 +481,7 @@ class Utils:
         name: str,
         project: str = PROJECT,
     ) -> str:
-        from google.cloud import pubsub
-
-        subscriber = pubsub.SubscriberClient()
+        subscriber = pubsub_subscriber_client()
         subscription_path = subscriber.subscription_path(
             project, Utils.hyphen_name(name)
         )
@@ -481,39 +512,47 @@ class Utils:
     @staticmethod
     def pubsub_publisher(
         topic_path: str,
-        new_msg: Callable[[int], str] = lambda i: json.dumps(
+        new_msg: Callable[[int], str | bytes] = lambda i: _json_dumps(
             {"id": i, "content": f"message {i}"}
         ),
         sleep_sec: int = 1,
     ) -> bool:
-        from google.cloud import pubsub
+        stop = threading.Event()
 
         def _infinite_publish_job() -> None:
-            publisher_client = pubsub.PublisherClient()
+            from google.cloud import pubsub
+
+            # A dedicated client configured for batching: publishes are
+            # buffered and flushed every 100 messages or 100 ms by the
+            # client's own thread, so the loop never blocks on an ack.
+            publisher_client = pubsub.PublisherClient(
+                batch_settings=pubsub.types.BatchSettings(
+                    max_messages=100, max_latency=0.1
+                )
+            )
             for i in itertools.count():
+                if stop.is_set():
+                    break
                 msg = new_msg(i)
-                publisher_client.publish(topic_path, msg.encode("utf-8")).result()
+                if not isinstance(msg, bytes):
+                    msg = msg.encode("utf-8")
+                publisher_client.publish(topic_path, msg)
                 time.sleep(sleep_sec)
+            # Flush whatever is still buffered before the thread exits.
+            publisher_client.stop()
 
-        # Start a subprocess in the background to do the publishing.
+        # Start a daemon thread in the background to do the publishing;
+        # daemon so the interpreter can still exit if the stop flag is
+        # somehow never honored.
         logging.info(f"Starting publisher on {topic_path}")
-        p = mp.Process(target=_infinite_publish_job)
-
-        # We set the subprocess as a daemon so the main process doesn't wait for
-        # the subprocess to finish. Since this is an infinite loop, it will
-        # never finish, so it would cause the whole test to hang.
-        # Typically, `terminate` should stop the subprocess during the fixture
-        # cleanup phase, but we've had cases where the tests hang, most likely
-        # due to concurrency issues with pytest running in parallel.
-        #   https://docs.python.org/3/library/multiprocessing.html#multiprocessing.Process.daemon
-        p.daemon = True
-        p.start()
+        t = threading.Thread(target=_infinite_publish_job, daemon=True)
+        t.start()
 
-        yield p.is_alive()
+        yield t.is_alive()
 
-        # For cleanup, terminate the background process.
+        # For cleanup, signal the publisher loop to stop.
         logging.info("Stopping publisher")
-        p.terminate()
+        stop.set()
 
     @staticmethod
     def cloud_build_submit(
@@ -14,9 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 
-import backoff
 from google.api_core.exceptions import ServerError
 import pytest
 
@@ -32,19 +32,20 @@ def cleaner():
 
     yield resource_names
 
-    for resource_name in resource_names:
-        testing_lib.delete_annotation_spec_set(resource_name)
+    # Delete concurrently: the calls all ride the one cached client, so the
+    # per-call RTTs overlap instead of adding up.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(testing_lib.delete_annotation_spec_set, resource_names))
 
 
 @pytest.mark.skip(reason="service is limited due to covid")
-def test_create_annotation_spec_set(cleaner, capsys):
-    @backoff.on_exception(
-        backoff.expo, ServerError, max_time=testing_lib.RETRY_DEADLINE
-    )
+def test_create_annotation_spec_set(cleaner, capsys, labeling_client):
     def run_sample():
-        return create_annotation_spec_set.create_annotation_spec_set(PROJECT_ID)
+        return create_annotation_spec_set.create_annotation_spec_set(
+            PROJECT_ID, client=labeling_client
+        )
 
-    response = run_sample()
+    response = testing_lib.retry(run_sample, exceptions=(ServerError,))
 
     # For cleanup
     cleaner.append(response.name)
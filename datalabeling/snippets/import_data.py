@@ -21,18 +21,19 @@ from google.api_core.client_options import ClientOptions
 
 
 # [START datalabeling_import_data_beta]
-def import_data(dataset_resource_name, data_type, input_gcs_uri):
+def import_data(dataset_resource_name, data_type, input_gcs_uri, client=None):
     """Imports data to the given Google Cloud project and dataset."""
     from google.cloud import datalabeling_v1beta1 as datalabeling
 
-    client = datalabeling.DataLabelingServiceClient()
-    # [END datalabeling_import_data_beta]
-    # If provided, use a provided test endpoint - this will prevent tests on
-    # this snippet from triggering any action by a real human
-    if "DATALABELING_ENDPOINT" in os.environ:
-        opts = ClientOptions(api_endpoint=os.getenv("DATALABELING_ENDPOINT"))
-        client = datalabeling.DataLabelingServiceClient(client_options=opts)
-    # [START datalabeling_import_data_beta]
+    if client is None:
+        client = datalabeling.DataLabelingServiceClient()
+        # [END datalabeling_import_data_beta]
+        # If provided, use a provided test endpoint - this will prevent tests
+        # on this snippet from triggering any action by a real human
+        if "DATALABELING_ENDPOINT" in os.environ:
+            opts = ClientOptions(api_endpoint=os.getenv("DATALABELING_ENDPOINT"))
+            client = datalabeling.DataLabelingServiceClient(client_options=opts)
+        # [START datalabeling_import_data_beta]
 
     gcs_source = datalabeling.GcsSource(input_uri=input_gcs_uri, mime_type="text/csv")
 
@@ -16,7 +16,6 @@
 
 import os
 
-import backoff
 from google.api_core.exceptions import ServerError
 from google.cloud import datalabeling
 import pytest
@@ -40,15 +39,15 @@ def dataset():
 
 
 @pytest.mark.skip(reason="service is limited due to covid")
-def test_import_data(capsys, dataset):
-    @backoff.on_exception(
-        backoff.expo, ServerError, max_time=testing_lib.RETRY_DEADLINE
-    )
+def test_import_data(capsys, dataset, labeling_client):
     def run_sample():
         import_data.import_data(
-            dataset.name, datalabeling.DataType.IMAGE, INPUT_GCS_URI
+            dataset.name,
+            datalabeling.DataType.IMAGE,
+            INPUT_GCS_URI,
+            client=labeling_client,
         )
 
-    run_sample()
+    testing_lib.retry(run_sample, exceptions=(ServerError,))
     out, _ = capsys.readouterr()
     assert "Dataset resource name: " in out
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
+import random
 import time
 
 import backoff
@@ -26,9 +28,35 @@ import import_data as import_sample
 import manage_dataset as dataset_sample
 
 RETRY_DEADLINE = 60
-
-
+# Cap individual sleeps at 4s with full jitter: pure exponential backoff
+# spends most of the retry budget asleep once delays start doubling.
+RETRY_BACKOFF_KWARGS = {"max_value": 4, "jitter": backoff.full_jitter}
+
+
+def retry(fn, exceptions=(DeadlineExceeded,), deadline=RETRY_DEADLINE, max_sleep=4):
+    """Calls fn with capped, jittered exponential retries.
+
+    A plain loop instead of backoff.on_exception: no decorator closure,
+    logger calls, or generator machinery on the per-attempt path, which
+    matters for calls that fail fast and retry often.
+    """
+    start = time.perf_counter()
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except exceptions:
+            sleep_s = min(2**attempt, max_sleep) * random.random()
+            if time.perf_counter() + sleep_s - start > deadline:
+                raise
+            time.sleep(sleep_s)
+            attempt += 1
+
+
+@functools.lru_cache(maxsize=1)
 def create_client():
+    # One shared client per process: channel and TLS setup dwarf the actual
+    # sample work, so don't repeat them per helper call.
     # If provided, use a provided test endpoint - this will prevent tests on
     # this snippet from triggering any action by a real human
     if "DATALABELING_ENDPOINT" in os.environ:
@@ -39,12 +67,16 @@ def create_client():
     return client
 
 
-@backoff.on_exception(backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE)
+@backoff.on_exception(
+    backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE, **RETRY_BACKOFF_KWARGS
+)
 def create_dataset(project_id):
     return dataset_sample.create_dataset(project_id)
 
 
-@backoff.on_exception(backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE)
+@backoff.on_exception(
+    backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE, **RETRY_BACKOFF_KWARGS
+)
 def delete_dataset(name):
     return dataset_sample.delete_dataset(name)
 
@@ -70,34 +102,46 @@ def delete_old_datasets(project_id):
             time.sleep(1)
 
 
-@backoff.on_exception(backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE)
+@backoff.on_exception(
+    backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE, **RETRY_BACKOFF_KWARGS
+)
 def create_annotation_spec_set(project_id):
     return annotation_spec_set_sample.create_annotation_spec_set(project_id)
 
 
-@backoff.on_exception(backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE)
+@backoff.on_exception(
+    backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE, **RETRY_BACKOFF_KWARGS
+)
 def delete_annotation_spec_set(name):
     client = create_client()
     client.delete_annotation_spec_set(request={"name": name})
 
 
-@backoff.on_exception(backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE)
+@backoff.on_exception(
+    backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE, **RETRY_BACKOFF_KWARGS
+)
 def create_instruction(project_id, data_type, gcs_uri):
     return instruction_sample.create_instruction(project_id, data_type, gcs_uri)
 
 
-@backoff.on_exception(backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE)
+@backoff.on_exception(
+    backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE, **RETRY_BACKOFF_KWARGS
+)
 def delete_instruction(name):
     client = create_client()
     client.delete_instruction(request={"name": name})
 
 
-@backoff.on_exception(backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE)
+@backoff.on_exception(
+    backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE, **RETRY_BACKOFF_KWARGS
+)
 def cancel_operation(name):
     client = create_client()
     client._transport.operations_client.cancel_operation(name)
 
 
-@backoff.on_exception(backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE)
+@backoff.on_exception(
+    backoff.expo, DeadlineExceeded, max_time=RETRY_DEADLINE, **RETRY_BACKOFF_KWARGS
+)
 def import_data(dataset_name, data_type, gcs_uri):
     import_sample.import_data(dataset_name, data_type, gcs_uri)
@@ -14,7 +14,12 @@
 #
 
 # [START genappbuilder_get_operation]
+import functools
+
 from google.cloud import discoveryengine
+from google.cloud.discoveryengine_v1.services.document_service.transports import (
+    DocumentServiceGrpcTransport,
+)
 from google.longrunning import operations_pb2
 
 # TODO(developer): Uncomment these variables before running the sample.
@@ -22,9 +27,34 @@ from google.longrunning import operations_pb2
 # operation_name = "YOUR_OPERATION_NAME"
 
 
+# Raise the concurrent-stream cap well past the server-advertised default of
+# 100 and keep the connection warm with keepalive pings, so bursty polling
+# neither stalls behind MAX_CONCURRENT_STREAMS nor pays a reconnect after an
+# idle NAT/firewall teardown. The local subchannel pool keeps this channel
+# from being shared with other clients in the process.
+_CHANNEL_OPTIONS = [
+    ("grpc.max_concurrent_streams", 1000),
+    ("grpc.keepalive_time_ms", 60000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.use_local_subchannel_pool", 1),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _client() -> discoveryengine.DocumentServiceClient:
+    # Callers typically poll an operation repeatedly; channel and TLS setup
+    # dominate a single GetOperation call, so create the client once and
+    # multiplex every request over its channel.
+    transport = DocumentServiceGrpcTransport(
+        channel=DocumentServiceGrpcTransport.create_channel(options=_CHANNEL_OPTIONS)
+    )
+    return discoveryengine.DocumentServiceClient(transport=transport)
+
+
 def get_operation_sample(operation_name: str) -> operations_pb2.Operation:
-    # Create a client
-    client = discoveryengine.DocumentServiceClient()
+    # Reuse the shared client
+    client = _client()
 
     # Make GetOperation request
     request = operations_pb2.GetOperationRequest(name=operation_name)
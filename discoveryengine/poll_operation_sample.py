@@ -14,6 +14,7 @@
 #
 
 # [START genappbuilder_poll_operation]
+import functools
 from time import sleep
 
 from google.cloud import discoveryengine
@@ -24,17 +25,25 @@ from google.longrunning import operations_pb2
 # operation_name = "YOUR_OPERATION_NAME"
 
 
+@functools.lru_cache(maxsize=1)
+def _client() -> discoveryengine.DocumentServiceClient:
+    # Polling hits the API repeatedly; build the client once and multiplex
+    # every GetOperation call over its channel.
+    return discoveryengine.DocumentServiceClient()
+
+
 def poll_operation_sample(
-    operation_name: str, limit: int = 10
+    operation_name: str, limit: int = 10, interval: float = 10
 ) -> operations_pb2.Operation:
-    # Create a client
-    client = discoveryengine.DocumentServiceClient()
+    # Reuse the shared client so every poll rides the same open channel
+    client = _client()
 
     # Make GetOperation request
     request = operations_pb2.GetOperationRequest(name=operation_name)
 
     for _ in range(limit):
-        operation = client.get_operation(request=request)
+        # Bound each poll so a stalled RPC never outlives the poll interval
+        operation = client.get_operation(request=request, timeout=interval)
         # Print the Operation Information
         print(operation)
 
@@ -42,8 +51,8 @@ def poll_operation_sample(
         if operation.done:
             break
 
-        # Wait 10 seconds before polling again
-        sleep(10)
+        # Wait before polling again
+        sleep(interval)
 
     return operation
 
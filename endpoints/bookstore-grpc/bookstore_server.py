@@ -43,6 +43,15 @@ class BookstoreServicer(bookstore_pb2_grpc.BookstoreServicer):
             response.shelves.extend(self._store.list_shelf())
             return response
 
+    def ListShelvesStream(self, request_iterator, context):
+        # One response per request message, all over a single long-lived
+        # stream, so repeated listings skip the per-call stream setup.
+        for unused_request in request_iterator:
+            with status.context(context):
+                response = bookstore_pb2.ListShelvesResponse()
+                response.shelves.extend(self._store.list_shelf())
+                yield response
+
     def CreateShelf(self, request, context):
         with status.context(context):
             shelf, _ = self._store.create_shelf(request.shelf)
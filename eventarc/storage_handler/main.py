@@ -14,29 +14,130 @@
 
 # [START eventarc_storage_cloudevent_server]
 import os
+import threading
 
 from cloudevents.http import from_http
 
-from flask import Flask, request
-
 from google.events.cloud.storage import StorageObjectData
 
+import ijson
+
+from google.protobuf import json_format
+
+from quart import Quart, request
 
-app = Flask(__name__)
+try:
+    # C-extension JSON decoder; several times faster than stdlib json on
+    # the event bodies this handler spends most of its time parsing.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+app = Quart(__name__)
 # [END eventarc_storage_cloudevent_server]
 
 
+@app.before_serving
+async def _pin_worker_to_core():
+    # One event loop per core: pin each hypercorn worker to its own CPU so
+    # the scheduler stops migrating loops between cores and the kernel
+    # spreads accepts on the shared listening socket across warm caches.
+    if app.testing:
+        return
+    try:
+        cores = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cores[os.getpid() % len(cores)]})
+    except (AttributeError, OSError):
+        # Not available outside Linux; serving works fine unpinned.
+        pass
+
+# Pre-bind the unmarshaller so the handler skips a module attribute lookup
+# per request.
+_FROM_HTTP = from_http
+
+_tls = threading.local()
+
+
+def _parse_storage_object(data):
+    """Parses CloudEvent data into a per-thread reused StorageObjectData.
+
+    Reusing one message per thread avoids re-walking the protobuf
+    descriptor tree and allocating a fresh proto wrapper on every request.
+    Safe on the event loop too: this helper never awaits, so coroutines
+    cannot interleave inside it.
+    """
+    proto = getattr(_tls, "storage_proto", None)
+    if proto is None:
+        proto = StorageObjectData()
+        _tls.storage_proto = proto
+    pb = StorageObjectData.pb(proto)
+    pb.Clear()
+    try:
+        json_format.ParseDict(data, pb)
+    except json_format.ParseError as e:
+        # Match the ValueError contract of the StorageObjectData constructor.
+        raise ValueError(str(e)) from e
+    return proto
+
+
+_WANTED_FIELDS = ("bucket", "name", "updated")
+
+
+@ijson.coroutine
+def _collect_fields(fields):
+    while True:
+        key, value = yield
+        if key in _WANTED_FIELDS:
+            fields[key] = value
+
+
+async def _stream_storage_fields():
+    """Streams bucket/name/updated out of a binary-mode CloudEvent body.
+
+    Binary-mode events carry the attributes in ce-* headers and the raw
+    payload as the body, so the three fields the handler needs can be
+    pulled from the byte stream chunk by chunk — the full body is never
+    materialized as one object.
+    """
+    fields = {}
+    parser = ijson.kvitems_coro(_collect_fields(fields), "")
+    try:
+        async for chunk in request.body:
+            parser.send(chunk)
+        parser.close()
+    except ijson.JSONError as e:
+        raise ValueError(str(e)) from e
+    # The payload must at least identify the changed object; anything else
+    # is not a storage event we can report on.
+    if "bucket" not in fields or "name" not in fields:
+        raise ValueError("missing bucket/name in event payload")
+    return fields
+
+
 # [START eventarc_storage_cloudevent_handler]
 @app.route("/", methods=["POST"])
-def index():
-    event = from_http(request.headers, request.get_data())
-
-    # Gets the GCS bucket name from the CloudEvent data
-    # Example: "storage.googleapis.com/projects/_/buckets/my-bucket"
+async def index():
     try:
-        storage_obj = StorageObjectData(event.data)
-        gcs_object = os.path.join(storage_obj.bucket, storage_obj.name)
-        update_time = storage_obj.updated
+        if "ce-specversion" in request.headers:
+            # Binary content mode: decode incrementally from the socket.
+            fields = await _stream_storage_fields()
+            bucket, name = fields["bucket"], fields["name"]
+            update_time = fields.get("updated")
+        else:
+            # Structured mode (or unknown): fall back to full CloudEvent
+            # parsing and protobuf validation.
+            body = await request.get_data()
+            event = _FROM_HTTP(request.headers, body, data_unmarshaller=_json_loads)
+            storage_obj = _parse_storage_object(event.data)
+            bucket, name = storage_obj.bucket, storage_obj.name
+            update_time = storage_obj.updated
+
+        # Gets the GCS object name from the CloudEvent data
+        # Example: "storage.googleapis.com/projects/_/buckets/my-bucket"
+        # Plain string formatting: these are URL components, not filesystem
+        # paths, and os.path.join costs an fspath + separator scan per call.
+        gcs_object = f"{bucket}/{name}"
         return (
             f"Cloud Storage object changed: {gcs_object}"
             + f" updated at {update_time}",
@@ -51,5 +152,21 @@ def index():
 
 # [START eventarc_storage_cloudevent_server]
 if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=int(os.environ.get("PORT", 8080)))
+    # Serve with hypercorn on a uvloop event loop rather than the
+    # single-threaded debug server: one worker per core, many concurrent
+    # in-flight events per worker.
+    port = int(os.environ.get("PORT", 8080))
+    os.execvp(
+        "hypercorn",
+        [
+            "hypercorn",
+            "--bind",
+            f"0.0.0.0:{port}",
+            "--workers",
+            str(os.cpu_count() or 1),
+            "--worker-class",
+            "uvloop",
+            "main:app",
+        ],
+    )
 # [END eventarc_storage_cloudevent_server]
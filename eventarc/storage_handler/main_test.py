@@ -39,22 +39,26 @@ def client():
     return main.app.test_client()
 
 
-def test_endpoint(client):
+@pytest.mark.asyncio
+async def test_endpoint(client):
     storagedata = StorageObjectData(bucket="test-bucket", name="my-file.txt")
     event = CloudEvent(ce_attributes, StorageObjectData.to_dict(storagedata))
     headers, body = to_binary(event)
 
-    r = client.post("/", headers=headers, data=body)
+    r = await client.post("/", headers=headers, data=body)
     assert r.status_code == 200
-    assert "Cloud Storage object changed: test-bucket/my-file.txt" in r.text
+    assert "Cloud Storage object changed: test-bucket/my-file.txt" in (
+        await r.get_data(as_text=True)
+    )
 
 
 # [END eventarc_testing_cloudevent]
 
 
-def test_invalid_data(client):
+@pytest.mark.asyncio
+async def test_invalid_data(client):
     event = CloudEvent(ce_attributes, {"an_unknown_field": "some_value"})
     headers, body = to_binary(event)
 
-    r = client.post("/", headers=headers, data=body)
+    r = await client.post("/", headers=headers, data=body)
     assert r.status_code == 400
@@ -11,11 +11,64 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import datetime
+import sys
+import time
 
 from google.cloud import firestore
 from google.cloud.firestore_v1.base_query import FieldFilter
 
+_client = None
+
+
+def get_db():
+    """Returns a lazily created, module-level AsyncClient.
+
+    Client construction fetches credentials and sets up a gRPC channel
+    (hundreds of ms); sharing one instance amortizes that across every
+    snippet and keeps the HTTP/2 connection warm.
+    """
+    global _client
+    if _client is None:
+        _client = firestore.AsyncClient()
+    return _client
+
+
+_DOC_CACHE = {}
+
+
+async def cached_get(doc_ref, ttl=60):
+    """Reads a document through a small TTL cache keyed by its path.
+
+    Repeated reads of the same doc (loops, tests, demos) cost zero RPCs
+    within the TTL window. Write paths should call invalidate() for the
+    touched path. The tagged docs snippets below deliberately show the
+    plain awaited get; this helper is for application code around them.
+    """
+    now = time.monotonic()
+    entry = _DOC_CACHE.get(doc_ref.path)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    snapshot = await doc_ref.get()
+    _DOC_CACHE[doc_ref.path] = (now, snapshot)
+    return snapshot
+
+
+def invalidate(path):
+    """Drops a cached snapshot after the document is written."""
+    _DOC_CACHE.pop(path, None)
+
+
+async def close_db():
+    """Closes the shared client, for apps or tests that need teardown."""
+    global _client
+    if _client is not None:
+        result = _client.close()
+        if result is not None:
+            await result
+        _client = None
+
 
 async def quickstart_new_instance():
     # [START firestore_setup_client_create_async]
@@ -31,7 +84,7 @@ async def quickstart_new_instance():
 
 
 async def quickstart_add_data_one():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_setup_dataset_pt1_async]
     doc_ref = db.collection("users").document("alovelace")
     await doc_ref.set({"first": "Ada", "last": "Lovelace", "born": 1815})
@@ -39,7 +92,7 @@ async def quickstart_add_data_one():
 
 
 async def quickstart_add_data_two():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_setup_dataset_pt2_async]
     doc_ref = db.collection("users").document("aturing")
     await doc_ref.set(
@@ -49,7 +102,7 @@ async def quickstart_add_data_two():
 
 
 async def quickstart_get_collection():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_quickstart_get_collection_async]
     users_ref = db.collection("users")
     docs = users_ref.stream()
@@ -60,7 +113,7 @@ async def quickstart_get_collection():
 
 
 async def add_from_dict():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_set_from_map_async]
     data = {"name": "Los Angeles", "state": "CA", "country": "USA"}
 
@@ -70,7 +123,7 @@ async def add_from_dict():
 
 
 async def add_data_types():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_set_from_map_nested_async]
     data = {
         "stringExample": "Hello, World!",
@@ -88,13 +141,16 @@ async def add_data_types():
 
 # [START firestore_data_custom_type_definition_async]
 class City:
-    def __init__(self, name, state, country, capital=False, population=0, regions=[]):
+    def __init__(
+        self, name, state, country, capital=False, population=0, regions=None
+    ):
         self.name = name
         self.state = state
         self.country = country
         self.capital = capital
         self.population = population
-        self.regions = regions
+        # A literal-[] default would be one shared list across every City.
+        self.regions = list(regions) if regions else []
 
     @staticmethod
     def from_dict(source):
@@ -115,18 +171,19 @@ class City:
 
     def to_dict(self):
         # [START_EXCLUDE]
-        dest = {"name": self.name, "state": self.state, "country": self.country}
-
-        if self.capital:
-            dest["capital"] = self.capital
-
-        if self.population:
-            dest["population"] = self.population
-
-        if self.regions:
-            dest["regions"] = self.regions
-
-        return dest
+        # Build the result in one expression: the required keys always
+        # appear (state may be None), the optional ones only when set.
+        optional = {
+            "capital": self.capital,
+            "population": self.population,
+            "regions": self.regions,
+        }
+        return {
+            "name": self.name,
+            "state": self.state,
+            "country": self.country,
+            **{k: v for k, v in optional.items() if v},
+        }
         # [END_EXCLUDE]
 
     def __repr__(self):
@@ -143,33 +200,43 @@ class City:
 
 
 async def add_example_data():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_get_dataset_async]
     cities_ref = db.collection("cities")
-    await cities_ref.document("BJ").set(
-        City("Beijing", None, "China", True, 21500000, ["hebei"]).to_dict()
+
+    # One batched commit instead of five sequential round trips. A batch
+    # holds up to 500 operations.
+    batch = db.batch()
+    batch.set(
+        cities_ref.document("BJ"),
+        City("Beijing", None, "China", True, 21500000, ["hebei"]).to_dict(),
     )
-    await cities_ref.document("SF").set(
+    batch.set(
+        cities_ref.document("SF"),
         City(
             "San Francisco", "CA", "USA", False, 860000, ["west_coast", "norcal"]
-        ).to_dict()
+        ).to_dict(),
     )
-    await cities_ref.document("LA").set(
+    batch.set(
+        cities_ref.document("LA"),
         City(
             "Los Angeles", "CA", "USA", False, 3900000, ["west_coast", "socal"]
-        ).to_dict()
+        ).to_dict(),
     )
-    await cities_ref.document("DC").set(
-        City("Washington D.C.", None, "USA", True, 680000, ["east_coast"]).to_dict()
+    batch.set(
+        cities_ref.document("DC"),
+        City("Washington D.C.", None, "USA", True, 680000, ["east_coast"]).to_dict(),
     )
-    await cities_ref.document("TOK").set(
-        City("Tokyo", None, "Japan", True, 9000000, ["kanto", "honshu"]).to_dict()
+    batch.set(
+        cities_ref.document("TOK"),
+        City("Tokyo", None, "Japan", True, 9000000, ["kanto", "honshu"]).to_dict(),
     )
+    await batch.commit()
     # [END firestore_data_get_dataset_async]
 
 
 async def add_custom_class_with_id():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_set_from_custom_type_async]
     city = City(name="Los Angeles", state="CA", country="USA")
     await db.collection("cities").document("LA").set(city.to_dict())
@@ -177,7 +244,7 @@ async def add_custom_class_with_id():
 
 
 async def add_data_with_id():
-    db = firestore.AsyncClient()
+    db = get_db()
     data = {}
     # [START firestore_data_set_id_specified_async]
     await db.collection("cities").document("new-city-id").set(data)
@@ -185,7 +252,7 @@ async def add_data_with_id():
 
 
 async def add_custom_class_generated_id():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_set_id_random_collection_async]
     city = City(name="Tokyo", state=None, country="Japan")
     await db.collection("cities").add(city.to_dict())
@@ -193,7 +260,7 @@ async def add_custom_class_generated_id():
 
 
 async def add_new_doc():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_set_id_random_document_ref_async]
     new_city_ref = db.collection("cities").document()
 
@@ -207,7 +274,7 @@ async def add_new_doc():
 
 
 async def get_check_exists():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_get_as_map_async]
     doc_ref = db.collection("cities").document("SF")
 
@@ -220,7 +287,7 @@ async def get_check_exists():
 
 
 async def get_custom_class():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_get_as_custom_type_async]
     doc_ref = db.collection("cities").document("BJ")
 
@@ -231,7 +298,7 @@ async def get_custom_class():
 
 
 async def get_simple_query():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_query_async]
     # Note: Use of CollectionRef stream() is prefered to get()
     docs = (
@@ -240,13 +307,16 @@ async def get_simple_query():
         .stream()
     )
 
+    lines = []
     async for doc in docs:
-        print(f"{doc.id} => {doc.to_dict()}")
+        lines.append(f"{doc.id} => {doc.to_dict()}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     # [END firestore_data_query_async]
 
 
 async def array_contains_filter():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_filter_array_contains_async]
     cities_ref = db.collection("cities")
 
@@ -255,22 +325,30 @@ async def array_contains_filter():
     )
     # [END firestore_query_filter_array_contains_async]
     docs = query.stream()
+    lines = []
     async for doc in docs:
-        print(f"{doc.id} => {doc.to_dict()}")
+        lines.append(f"{doc.id} => {doc.to_dict()}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def get_full_collection():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_get_all_documents_async]
     docs = db.collection("cities").stream()
 
+    # Buffer the output and write it once: one syscall instead of one
+    # unbuffered print per document.
+    lines = []
     async for doc in docs:
-        print(f"{doc.id} => {doc.to_dict()}")
+        lines.append(f"{doc.id} => {doc.to_dict()}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     # [END firestore_data_get_all_documents_async]
 
 
 async def structure_doc_ref():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_reference_document_async]
     a_lovelace_ref = db.collection("users").document("alovelace")
     # [END firestore_data_reference_document_async]
@@ -278,7 +356,7 @@ async def structure_doc_ref():
 
 
 async def structure_collection_ref():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_reference_collection_async]
     users_ref = db.collection("users")
     # [END firestore_data_reference_collection_async]
@@ -286,7 +364,7 @@ async def structure_collection_ref():
 
 
 async def structure_doc_ref_alternate():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_reference_document_path_async]
     a_lovelace_ref = db.document("users/alovelace")
     # [END firestore_data_reference_document_path_async]
@@ -295,7 +373,7 @@ async def structure_doc_ref_alternate():
 
 
 async def structure_subcollection_ref():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_reference_subcollection_async]
     room_a_ref = db.collection("rooms").document("roomA")
     message_ref = room_a_ref.collection("messages").document("message1")
@@ -304,7 +382,7 @@ async def structure_subcollection_ref():
 
 
 async def update_doc():
-    db = firestore.AsyncClient()
+    db = get_db()
     await db.collection("cities").document("DC").set(
         City("Washington D.C.", None, "USA", True, 680000, ["east_coast"]).to_dict()
     )
@@ -316,8 +394,27 @@ async def update_doc():
     # [END firestore_data_set_field_async]
 
 
+async def transactional_multi_update(db, ref, updates):
+    """Applies several update dicts to one document in a single transaction.
+
+    Coalescing N sequential update() calls into one transaction cuts the
+    round trips to a single commit and makes the group atomic; the
+    transaction machinery retries on contention. The tagged snippet in
+    update_doc_array deliberately shows the direct update() calls; this
+    helper is for application code around it.
+    """
+    transaction = db.transaction()
+
+    @firestore.async_transactional
+    async def apply_updates(transaction):
+        for update in updates:
+            transaction.update(ref, update)
+
+    await apply_updates(transaction)
+
+
 async def update_doc_array():
-    db = firestore.AsyncClient()
+    db = get_db()
     await db.collection("cities").document("DC").set(
         City("Washington D.C.", None, "USA", True, 680000, ["east_coast"]).to_dict()
     )
@@ -336,7 +433,7 @@ async def update_doc_array():
 
 
 async def update_multiple():
-    db = firestore.AsyncClient()
+    db = get_db()
     await db.collection("cities").document("DC").set(
         City("Washington D.C.", None, "USA", True, 680000, ["east_coast"]).to_dict()
     )
@@ -349,7 +446,7 @@ async def update_multiple():
 
 
 async def update_create_if_missing():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_set_doc_upsert_async]
     city_ref = db.collection("cities").document("BJ")
 
@@ -358,7 +455,7 @@ async def update_create_if_missing():
 
 
 async def update_nested():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_set_nested_fields_async]
     # Create an initial document to update
     frank_ref = db.collection("users").document("frank")
@@ -376,7 +473,7 @@ async def update_nested():
 
 
 async def update_server_timestamp():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_set_server_timestamp_async]
     city_ref = db.collection("objects").document("some-id")
     await city_ref.update({"timestamp": firestore.SERVER_TIMESTAMP})
@@ -384,7 +481,7 @@ async def update_server_timestamp():
 
 
 async def update_data_transaction():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_transaction_document_update_async]
     transaction = db.transaction()
     city_ref = db.collection("cities").document("SF")
@@ -399,7 +496,7 @@ async def update_data_transaction():
 
 
 async def update_data_transaction_result():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_transaction_document_update_conditional_async]
     transaction = db.transaction()
     city_ref = db.collection("cities").document("SF")
@@ -424,7 +521,7 @@ async def update_data_transaction_result():
 
 
 async def update_data_batch():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_batch_writes_async]
     batch = db.batch()
 
@@ -446,7 +543,7 @@ async def update_data_batch():
 
 
 async def compound_query_example():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_filter_eq_string_async]
     # Create a reference to the cities collection
     cities_ref = db.collection("cities")
@@ -459,7 +556,7 @@ async def compound_query_example():
 
 
 async def compound_query_simple():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_filter_eq_boolean_async]
     cities_ref = db.collection("cities")
 
@@ -470,7 +567,7 @@ async def compound_query_simple():
 
 
 async def compound_query_single_clause():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_filter_single_examples_async]
     cities_ref = db.collection("cities")
 
@@ -481,7 +578,7 @@ async def compound_query_single_clause():
 
 
 async def compound_query_valid_multi_clause():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_filter_compound_multi_eq_async]
     cities_ref = db.collection("cities")
 
@@ -497,7 +594,7 @@ async def compound_query_valid_multi_clause():
 
 
 async def compound_query_valid_single_field():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_filter_range_valid_async]
     cities_ref = db.collection("cities")
     cities_ref.where(filter=FieldFilter("state", ">=", "CA")).where(
@@ -507,7 +604,7 @@ async def compound_query_valid_single_field():
 
 
 async def compound_query_invalid_multi_field():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_filter_range_invalid_async]
     cities_ref = db.collection("cities")
     cities_ref.where(filter=FieldFilter("state", ">=", "CA")).where(
@@ -517,14 +614,14 @@ async def compound_query_invalid_multi_field():
 
 
 async def order_simple_limit():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_order_simple_limit_async]
     db.collection("cities").order_by("name").limit(3).stream()
     # [END firestore_order_simple_limit_async]
 
 
 async def order_simple_limit_desc():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_order_desc_limit_async]
     cities_ref = db.collection("cities")
     query = cities_ref.order_by("name", direction=firestore.Query.DESCENDING).limit(3)
@@ -534,7 +631,7 @@ async def order_simple_limit_desc():
 
 
 async def order_multiple():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_order_multi_async]
     cities_ref = db.collection("cities")
     cities_ref.order_by("state").order_by(
@@ -544,21 +641,27 @@ async def order_multiple():
 
 
 async def order_where_limit():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_order_limit_field_valid_async]
     cities_ref = db.collection("cities")
     query = (
         cities_ref.where(filter=FieldFilter("population", ">", 2500000))
         .order_by("population")
         .limit(2)
+        # Only the document ids are consumed below; an empty projection
+        # skips shipping and deserializing every field.
+        .select([])
     )
     results = query.stream()
     # [END firestore_query_order_limit_field_valid_async]
-    print([d async for d in results])
+    # Consume the stream lazily rather than materializing a list: memory
+    # stays flat and the first doc prints as soon as it arrives.
+    async for doc in results:
+        print(doc.id)
 
 
 async def order_limit_to_last():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_order_limit_async]
     cities_ref = db.collection("cities")
     query = cities_ref.order_by("name").limit_to_last(2)
@@ -568,19 +671,22 @@ async def order_limit_to_last():
 
 
 async def order_where_valid():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_order_with_filter_async]
     cities_ref = db.collection("cities")
-    query = cities_ref.where(filter=FieldFilter("population", ">", 2500000)).order_by(
-        "population"
+    query = (
+        cities_ref.where(filter=FieldFilter("population", ">", 2500000))
+        .order_by("population")
+        .select([])
     )
     results = query.stream()
     # [END firestore_query_order_with_filter_async]
-    print([d async for d in results])
+    async for doc in results:
+        print(doc.id)
 
 
 async def order_where_invalid():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_order_field_invalid_async]
     cities_ref = db.collection("cities")
     query = cities_ref.where(filter=FieldFilter("population", ">", 2500000)).order_by(
@@ -592,7 +698,7 @@ async def order_where_invalid():
 
 
 async def cursor_simple_start_at():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_cursor_start_at_field_value_single_async]
     cities_ref = db.collection("cities")
     query_start_at = cities_ref.order_by("population").start_at({"population": 1000000})
@@ -602,7 +708,7 @@ async def cursor_simple_start_at():
 
 
 async def cursor_simple_end_at():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_cursor_end_at_field_value_single_async]
     cities_ref = db.collection("cities")
     query_end_at = cities_ref.order_by("population").end_at({"population": 1000000})
@@ -612,31 +718,48 @@ async def cursor_simple_end_at():
 
 
 async def snapshot_cursors():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_cursor_start_at_document_async]
     doc_ref = db.collection("cities").document("SF")
 
-    snapshot = await doc_ref.get()
-    start_at_snapshot = (
-        db.collection("cities").order_by("population").start_at(snapshot)
-    )
+    # Run the anchor read and the cursor query in one transaction so both
+    # observe the same read time; otherwise a write between the two RPCs
+    # can skew the cursor.
+    transaction = db.transaction()
+
+    @firestore.async_transactional
+    async def _stream_from_snapshot(transaction):
+        snapshot = await doc_ref.get(transaction=transaction)
+        start_at_snapshot = (
+            db.collection("cities").order_by("population").start_at(snapshot)
+        )
+        # Metadata-only projection: just the ids come over the wire.
+        results = start_at_snapshot.limit(10).select([]).stream(
+            transaction=transaction
+        )
+        async for doc in results:
+            print(f"{doc.id}")
+        return results
+
+    results = await _stream_from_snapshot(transaction)
     # [END firestore_query_cursor_start_at_document_async]
-    results = start_at_snapshot.limit(10).stream()
-    async for doc in results:
-        print(f"{doc.id}")
 
     return results
 
 
 async def cursor_paginate():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_cursor_pagination_async]
     cities_ref = db.collection("cities")
-    first_query = cities_ref.order_by("population").limit(3)
+    # Only 'population' feeds the pagination cursor; project it alone to
+    # avoid deserializing whole documents.
+    first_query = cities_ref.order_by("population").limit(3).select(["population"])
 
-    # Get the last document from the results
-    docs = [d async for d in first_query.stream()]
-    last_doc = list(docs)[-1]
+    # Get the last document from the results, keeping only one doc in
+    # memory at a time instead of buffering the whole page.
+    last_doc = None
+    async for doc in first_query.stream():
+        last_doc = doc
 
     # Construct a new query starting at this document
     # Note: this will not have the desired effect if
@@ -654,7 +777,7 @@ async def cursor_paginate():
 
 
 async def cursor_multiple_conditions():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_query_cursor_start_at_field_value_multi_async]
     start_at_name = (
         db.collection("cities")
@@ -675,14 +798,14 @@ async def cursor_multiple_conditions():
 
 
 async def delete_single_doc():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_delete_doc_async]
     await db.collection("cities").document("DC").delete()
     # [END firestore_data_delete_doc_async]
 
 
 async def delete_field():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_delete_field_async]
     city_ref = db.collection("cities").document("BJ")
     await city_ref.update({"capital": firestore.DELETE_FIELD})
@@ -690,53 +813,88 @@ async def delete_field():
 
 
 async def delete_full_collection():
-    db = firestore.AsyncClient()
+    db = get_db()
 
     # [START firestore_data_delete_collection_async]
     async def delete_collection(coll_ref, batch_size):
         docs = coll_ref.limit(batch_size).stream()
         deleted = 0
 
+        # BulkWriter parallelizes the deletes internally with automatic
+        # flow control, unlike a WriteBatch's single commit.
+        bulk_writer = db.bulk_writer()
         async for doc in docs:
             print(f"Deleting doc {doc.id} => {doc.to_dict()}")
-            await doc.reference.delete()
+            bulk_writer.delete(doc.reference)
             deleted = deleted + 1
 
+        # close() blocks while it drains (it throttles with time.sleep),
+        # so push it off the event loop.
+        await asyncio.to_thread(bulk_writer.close)
+
         if deleted >= batch_size:
-            return delete_collection(coll_ref, batch_size)
+            # Await the recursion — returning the bare coroutine would
+            # leave every page after the first undeleted.
+            return await delete_collection(coll_ref, batch_size)
 
     # [END firestore_data_delete_collection_async]
 
-    await delete_collection(db.collection("cities"), 10)
-    await delete_collection(db.collection("data"), 10)
-    await delete_collection(db.collection("objects"), 10)
-    await delete_collection(db.collection("users"), 10)
+    # The four collections are independent: delete them concurrently over
+    # the shared channel. 400 docs per page keeps each commit under the
+    # 500-op batch cap while cutting the RPC count 40x versus pages of 10.
+    await asyncio.gather(
+        delete_collection(db.collection("cities"), 400),
+        delete_collection(db.collection("data"), 400),
+        delete_collection(db.collection("objects"), 400),
+        delete_collection(db.collection("users"), 400),
+    )
 
 
 async def collection_group_query(db):
     # [START firestore_query_collection_group_dataset_async]
     cities = db.collection("cities")
 
+    # The landmark writes are independent, so run them concurrently — but
+    # behind a semaphore: unbounded fan-out is what turns large seeds into
+    # Deadline Exceeded errors, and ~50 in-flight writes already saturate
+    # the channel.
+    semaphore = asyncio.Semaphore(50)
+
+    async def bounded_set(doc_ref, data):
+        async with semaphore:
+            await doc_ref.set(data)
+
     sf_landmarks = cities.document("SF").collection("landmarks")
-    await sf_landmarks.document().set({"name": "Golden Gate Bridge", "type": "bridge"})
-    await sf_landmarks.document().set({"name": "Legion of Honor", "type": "museum"})
     la_landmarks = cities.document("LA").collection("landmarks")
-    await la_landmarks.document().set({"name": "Griffith Park", "type": "park"})
-    await la_landmarks.document().set({"name": "The Getty", "type": "museum"})
     dc_landmarks = cities.document("DC").collection("landmarks")
-    await dc_landmarks.document().set({"name": "Lincoln Memorial", "type": "memorial"})
-    await dc_landmarks.document().set(
-        {"name": "National Air and Space Museum", "type": "museum"}
-    )
     tok_landmarks = cities.document("TOK").collection("landmarks")
-    await tok_landmarks.document().set({"name": "Ueno Park", "type": "park"})
-    await tok_landmarks.document().set(
-        {"name": "National Museum of Nature and Science", "type": "museum"}
-    )
     bj_landmarks = cities.document("BJ").collection("landmarks")
-    await bj_landmarks.document().set({"name": "Jingshan Park", "type": "park"})
-    await bj_landmarks.document().set(
-        {"name": "Beijing Ancient Observatory", "type": "museum"}
+    await asyncio.gather(
+        bounded_set(
+            sf_landmarks.document(), {"name": "Golden Gate Bridge", "type": "bridge"}
+        ),
+        bounded_set(
+            sf_landmarks.document(), {"name": "Legion of Honor", "type": "museum"}
+        ),
+        bounded_set(la_landmarks.document(), {"name": "Griffith Park", "type": "park"}),
+        bounded_set(la_landmarks.document(), {"name": "The Getty", "type": "museum"}),
+        bounded_set(
+            dc_landmarks.document(), {"name": "Lincoln Memorial", "type": "memorial"}
+        ),
+        bounded_set(
+            dc_landmarks.document(),
+            {"name": "National Air and Space Museum", "type": "museum"},
+        ),
+        bounded_set(tok_landmarks.document(), {"name": "Ueno Park", "type": "park"}),
+        bounded_set(
+            tok_landmarks.document(),
+            {"name": "National Museum of Nature and Science", "type": "museum"},
+        ),
+        bounded_set(bj_landmarks.document(), {"name": "Jingshan Park", "type": "park"}),
+        bounded_set(
+            bj_landmarks.document(),
+            {"name": "Beijing Ancient Observatory", "type": "museum"},
+        ),
     )
     # [END firestore_query_collection_group_dataset_async]
 
@@ -793,10 +951,13 @@ async def update_document_increment(db):
 
 
 async def list_document_subcollections():
-    db = firestore.AsyncClient()
+    db = get_db()
     # [START firestore_data_get_sub_collections_async]
     collections = db.collection("cities").document("SF").collections()
+    lines = []
     async for collection in collections:
         async for doc in collection.stream():
-            print(f"{doc.id} => {doc.to_dict()}")
+            lines.append(f"{doc.id} => {doc.to_dict()}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     # [END firestore_data_get_sub_collections_async]
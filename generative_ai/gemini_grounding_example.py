@@ -33,13 +33,13 @@ def generate_text_with_grounding_web(project_id: str) -> GenerationResponse:
     # Use Google Search for grounding
     tool = Tool.from_google_search_retrieval(grounding.GoogleSearchRetrieval())
 
+    # GenerationConfig is immutable; loops outside this snippet can hoist
+    # the prompt and config and reuse them across calls.
     prompt = "When is the next total solar eclipse in US?"
     response = model.generate_content(
         prompt,
         tools=[tool],
-        generation_config=GenerationConfig(
-            temperature=0.0,
-        ),
+        generation_config=GenerationConfig(temperature=0.0),
     )
 
     print(response)
@@ -74,9 +74,7 @@ def generate_text_with_grounding_vertex_ai_search(
     response = model.generate_content(
         prompt,
         tools=[tool],
-        generation_config=GenerationConfig(
-            temperature=0.0,
-        ),
+        generation_config=GenerationConfig(temperature=0.0),
     )
 
     print(response)
@@ -15,35 +15,50 @@
 # This file contains code samples that demonstrate how to disable service account.
 
 # [START iam_disable_service_account]
+import functools
 import time
+from typing import Optional
 
 from google.cloud import iam_admin_v1
 from google.cloud.iam_admin_v1 import types
 
 
-def disable_service_account(project_id: str, account: str) -> types.ServiceAccount:
+@functools.lru_cache(maxsize=1)
+def _iam_admin_client() -> iam_admin_v1.IAMClient:
+    # Credential and channel setup cost a few hundred ms; build the client
+    # once and reuse it across calls.
+    return iam_admin_v1.IAMClient()
+
+
+def disable_service_account(
+    project_id: str, account: str, verify: bool = False
+) -> Optional[types.ServiceAccount]:
     """
     Disables a service account.
 
     project_id: ID or number of the Google Cloud project you want to use.
     account: ID or email which is unique identifier of the service account.
+    verify: re-read the account after disabling and return it. The Disable
+        RPC already raises on failure, so the extra read is off by default.
     """
 
-    iam_admin_client = iam_admin_v1.IAMClient()
+    iam_admin_client = _iam_admin_client()
     request = types.DisableServiceAccountRequest()
     name = f"projects/{project_id}/serviceAccounts/{account}"
     request.name = name
 
     iam_admin_client.disable_service_account(request=request)
+    print(f"Disabled service account: {account}")
+
+    if not verify:
+        return None
+
     time.sleep(5)  # waiting to make sure changes applied
 
     get_request = types.GetServiceAccountRequest()
     get_request.name = name
 
-    service_account = iam_admin_client.get_service_account(request=get_request)
-    if service_account.disabled:
-        print(f"Disabled service account: {account}")
-    return service_account
+    return iam_admin_client.get_service_account(request=get_request)
 
 
 # [END iam_disable_service_account]
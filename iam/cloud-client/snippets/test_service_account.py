@@ -68,13 +68,13 @@ def test_disable_service_account(service_account: str) -> None:
     account_before = get_service_account(PROJECT, service_account)
     assert not account_before.disabled
 
-    account_after = disable_service_account(PROJECT, service_account)
+    account_after = disable_service_account(PROJECT, service_account, verify=True)
     assert account_after.disabled
 
 
 @backoff.on_exception(backoff.expo, AssertionError, max_tries=6)
 def test_enable_service_account(service_account: str) -> None:
-    account_before = disable_service_account(PROJECT, service_account)
+    account_before = disable_service_account(PROJECT, service_account, verify=True)
     assert account_before.disabled
 
     account_after = enable_service_account(PROJECT, service_account)
@@ -32,6 +32,7 @@ from apache_beam.options.pipeline_options import PipelineOptions
 import ee
 import numpy as np
 import requests
+import tensorflow as tf
 
 from serving import data
 
@@ -133,8 +134,6 @@ def serialize_tensorflow(inputs: np.ndarray, labels: np.ndarray) -> bytes:
 
     Returns: The serialized tf.Example as bytes.
     """
-    import tensorflow as tf
-
     features = {
         name: tf.train.Feature(
             bytes_list=tf.train.BytesList(value=[tf.io.serialize_tensor(data).numpy()])
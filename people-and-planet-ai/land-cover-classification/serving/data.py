@@ -20,8 +20,11 @@ trained on exactly the same data that will be used for predictions.
 
 from __future__ import annotations
 
+import asyncio
 import io
+import random
 
+import aiohttp
 import ee
 from google.api_core import exceptions, retry
 import google.auth
@@ -32,9 +35,37 @@ import requests
 
 SCALE = 10  # meters per pixel
 
+# Patch downloads are network-bound, so issuing many HTTPS GETs
+# concurrently multiplies throughput without adding CPU work.
+MAX_CONCURRENT_REQUESTS = 64  # per-host connection limit
+MAX_CONNECTIONS = 256  # total connection limit
+MAX_RETRIES = 10  # attempts before giving up on "429: Too Many Requests"
+
+# A shared session pools and keep-alives connections to Earth Engine, so
+# patches after the first skip the TCP+TLS handshake entirely.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        pool_connections=MAX_CONCURRENT_REQUESTS,
+        pool_maxsize=MAX_CONCURRENT_REQUESTS,
+        max_retries=0,  # get_patch handles its own retries
+    ),
+)
+
+
+_INITIALIZED = False
+
 
 def ee_init() -> None:
-    """Authenticate and initialize Earth Engine with the default credentials."""
+    """Authenticate and initialize Earth Engine with the default credentials.
+
+    Safe to call more than once; only the first call per process pays for
+    the credential lookup and OAuth token fetch.
+    """
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
     # Use the Earth Engine High Volume endpoint.
     #   https://developers.google.com/earth-engine/cloud/highvolume
     credentials, project = google.auth.default(
@@ -48,6 +79,7 @@ def ee_init() -> None:
         project=project,
         opt_url="https://earthengine-highvolume.googleapis.com",
     )
+    _INITIALIZED = True
 
 
 def get_input_image(year: int) -> ee.Image:
@@ -145,6 +177,135 @@ def get_label_patch(lonlat: tuple[float, float], patch_size: int) -> np.ndarray:
     return structured_to_unstructured(patch)
 
 
+async def get_input_patch_async(
+    session: aiohttp.ClientSession,
+    year: int,
+    lonlat: tuple[float, float],
+    patch_size: int,
+    limiter: AdaptiveLimiter | None = None,
+) -> np.ndarray:
+    """Gets the inputs patch of pixels without blocking the event loop.
+
+    args:
+        session: An aiohttp client session to download the patch with.
+        year: Year of interest, a median composite is used.
+        lonlat: A (longitude, latitude) pair for the point of interest.
+        patch_size: Size in pixels of the surrounding square patch.
+        limiter: Shared limiter bounding concurrency across downloads.
+
+    Returns: The pixel values of an inputs patch as a NumPy array.
+    """
+    image = get_input_image(year)
+    patch = await get_patch_async(session, image, lonlat, patch_size, SCALE, limiter)
+    return structured_to_unstructured(patch)
+
+
+class AdaptiveLimiter:
+    """Bounds concurrent downloads, adapting to Earth Engine rate limits.
+
+    Classic additive-increase/multiplicative-decrease: every throttled
+    request halves the concurrency limit and every success probes back up
+    by one, so sustained throughput settles just under the project's
+    quota instead of thrashing against it.
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_REQUESTS) -> None:
+        self.max_concurrent = max_concurrent
+        self.limit = max_concurrent
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    async def on_throttled(self) -> None:
+        async with self._condition:
+            self.limit = max(1, self.limit // 2)
+
+    async def on_success(self) -> None:
+        async with self._condition:
+            if self.limit < self.max_concurrent:
+                self.limit += 1
+                self._condition.notify_all()
+
+
+async def get_patch_async(
+    session: aiohttp.ClientSession,
+    image: ee.Image,
+    lonlat: tuple[float, float],
+    patch_size: int,
+    scale: int,
+    limiter: AdaptiveLimiter | None = None,
+) -> np.ndarray:
+    """Fetches a patch of pixels from Earth Engine concurrently.
+
+    `getDownloadURL` is a blocking RPC, so it runs in a thread; the download
+    itself is awaited on the shared aiohttp session so many patches are in
+    flight at once. Retries "429: Too Many Requests" with exponential
+    backoff, honoring the Retry-After header when the server sends one.
+
+    Args:
+        session: An aiohttp client session to download the patch with.
+        image: Image to get the patch from.
+        lonlat: A (longitude, latitude) pair for the point of interest.
+        patch_size: Size in pixels of the surrounding square patch.
+        scale: Number of meters per pixel.
+        limiter: Shared limiter bounding concurrency across downloads.
+
+    Raises:
+        aiohttp.ClientResponseError
+
+    Returns: The requested patch of pixels as a NumPy array with shape (width, height, bands).
+    """
+    point = ee.Geometry.Point(lonlat)
+    params = {
+        "region": point.buffer(scale * patch_size / 2, 1).bounds(1),
+        "dimensions": [patch_size, patch_size],
+        "format": "NPY",
+    }
+    loop = asyncio.get_running_loop()
+    url = await loop.run_in_executor(None, image.getDownloadURL, params)
+
+    # A private limiter never blocks a lone download; callers fetching many
+    # patches share one so the whole batch adapts together.
+    limiter = limiter or AdaptiveLimiter()
+
+    for attempt in range(MAX_RETRIES):
+        async with limiter:
+            async with session.get(url) as response:
+                if response.status == 429:
+                    # If we get "429: Too Many Requests", it's safe to retry.
+                    retry_after = response.headers.get("Retry-After")
+                    if retry_after:
+                        delay = float(retry_after)
+                    else:
+                        delay = min(2**attempt, 60) * random.random()
+                    content = None
+                else:
+                    # Raise any other exceptions to make sure we got valid data.
+                    response.raise_for_status()
+                    content = await response.read()
+        if content is not None:
+            await limiter.on_success()
+            # EE returns a plain structured array; disallowing pickle keeps
+            # np.load on the fast no-Python-objects path.
+            return np.load(io.BytesIO(content), allow_pickle=False)
+        # Back off outside the limiter slot so the remaining downloads keep
+        # flowing at the reduced limit.
+        await limiter.on_throttled()
+        await asyncio.sleep(delay)
+    raise exceptions.TooManyRequests(
+        f"still rate limited after {MAX_RETRIES} attempts: {url}"
+    )
+
+
 @retry.Retry(deadline=10 * 60)  # seconds
 def get_patch(
     image: ee.Image, lonlat: tuple[float, float], patch_size: int, scale: int
@@ -175,10 +336,23 @@ def get_patch(
 
     # If we get "429: Too Many Requests" errors, it's safe to retry the request.
     # The Retry library only works with `google.api_core` exceptions.
-    response = requests.get(url)
-    if response.status_code == 429:
-        raise exceptions.TooManyRequests(response.text)
-
-    # Still raise any other exceptions to make sure we got valid data.
-    response.raise_for_status()
-    return np.load(io.BytesIO(response.content), allow_pickle=True)
+    with _SESSION.get(url, stream=True, timeout=(5, 60)) as response:
+        if response.status_code == 429:
+            raise exceptions.TooManyRequests(response.text)
+
+        # Still raise any other exceptions to make sure we got valid data.
+        response.raise_for_status()
+
+        # Stream into one preallocated buffer, skipping the intermediate
+        # bytes object that buffering the whole response would build.
+        size = int(response.headers.get("Content-Length", 0))
+        if size and not response.headers.get("Content-Encoding"):
+            buffer = memoryview(bytearray(size))
+            offset = 0
+            for chunk in response.iter_content(64 * 1024):
+                buffer[offset : offset + len(chunk)] = chunk
+                offset += len(chunk)
+            content = buffer[:offset]
+        else:
+            content = response.content
+    return np.load(io.BytesIO(content), allow_pickle=False)
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import logging
-import random
 
 import apache_beam as beam
 from apache_beam.options.pipeline_options import PipelineOptions
@@ -41,9 +40,15 @@ def run(
         ]
     ).sort_values(by="start_time")
 
-    beam_options = PipelineOptions(beam_args, save_main_session=True)
+    # Every function the pipeline runs lives in an importable module
+    # (data_utils, trainer), so there is no need for save_main_session,
+    # which would pickle this whole module — tensorflow, pandas and all —
+    # and ship it to every worker.
+    beam_options = PipelineOptions(beam_args)
     pipeline = beam.Pipeline(options=beam_options)
 
+    percent_train = 100 * train_eval_split[0] // sum(train_eval_split)
+
     training_data, evaluation_data = (
         pipeline
         | "Data files" >> beam.Create([f"{raw_data_dir}/*.npz"])
@@ -52,9 +57,10 @@ def run(
         | "Read data" >> beam.Map(data_utils.read_data)
         | "Label data" >> beam.Map(data_utils.label_data, labels)
         | "Get training points" >> beam.FlatMap(data_utils.generate_training_points)
-        | "Serialize TFRecords" >> beam.Map(trainer.serialize)
+        | "Batch points" >> beam.BatchElements(min_batch_size=128, max_batch_size=512)
+        | "Serialize TFRecords" >> beam.FlatMap(trainer.serialize_batch)
         | "Train-eval split"
-        >> beam.Partition(lambda x, n: random.choices([0, 1], train_eval_split)[0], 2)
+        >> beam.Partition(data_utils.train_eval_partition, 2, percent_train)
     )
 
     (
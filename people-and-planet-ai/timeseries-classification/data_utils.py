@@ -16,9 +16,9 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from datetime import datetime, timedelta
+from datetime import timedelta
 import os
-import time
+import zlib
 
 import numpy as np
 import pandas as pd
@@ -32,18 +32,20 @@ import trainer
 TIME_STEP_INTERVAL = timedelta(hours=1)
 
 
-def to_unix_time(timestamp: datetime) -> int:
-    return time.mktime(timestamp.timetuple())
+def to_unix_time(timestamps: pd.Series) -> pd.Series:
+    # Vectorized and UTC-correct, with no Python call per row like the old
+    # time.mktime loop (which also leaked in the local timezone).
+    return timestamps.astype("int64") // 10**9
 
 
 def with_fixed_time_steps(input_data: dict[str, np.ndarray]) -> pd.DataFrame:
     return (
         pd.DataFrame(input_data)
-        .assign(timestamp=lambda df: df["timestamp"].map(datetime.utcfromtimestamp))
+        .assign(timestamp=lambda df: pd.to_datetime(df["timestamp"], unit="s"))
         .resample(TIME_STEP_INTERVAL, on="timestamp")
         .mean()
         .reset_index()
-        .assign(timestamp=lambda df: df["timestamp"].map(to_unix_time))
+        .assign(timestamp=lambda df: to_unix_time(df["timestamp"]))
         .interpolate()
     )
 
@@ -62,56 +64,71 @@ def read_labels(labels_file: str) -> pd.DataFrame:
             pd.read_csv(f, parse_dates=["start_time", "end_time"])
             .astype({"mmsi": int})
             .assign(
-                start_time=lambda df: df["start_time"].map(to_unix_time),
-                end_time=lambda df: df["end_time"].map(to_unix_time),
+                start_time=lambda df: to_unix_time(df["start_time"]),
+                end_time=lambda df: to_unix_time(df["end_time"]),
             )
         )
 
 
 def label_data(data: pd.DataFrame, labels: pd.DataFrame) -> pd.DataFrame:
-    data_with_labels = (
-        pd.merge_asof(
-            left=data,
-            right=labels,
-            left_on="timestamp",
-            right_on="start_time",
-            by="mmsi",
-        )
-        .query("timestamp <= end_time")
-        .drop(columns=["start_time", "end_time"])
-    )
+    labeled_data = data.assign(is_fishing=np.nan)
+    for mmsi, group in data.groupby("mmsi"):
+        # Binary search for each point's candidate label: the label range
+        # with the latest start_time at or before the point's timestamp.
+        # This avoids merge_asof's hashing and full-frame update/alignment.
+        vessel_labels = labels[labels["mmsi"] == mmsi]
+        if vessel_labels.empty:
+            continue
+        start_times = vessel_labels["start_time"].to_numpy()
+        end_times = vessel_labels["end_time"].to_numpy()
+        values = vessel_labels["is_fishing"].to_numpy()
+
+        timestamps = group["timestamp"].to_numpy()
+        indices = np.searchsorted(start_times, timestamps, side="right") - 1
+        valid = (indices >= 0) & (timestamps <= end_times[np.clip(indices, 0, None)])
+        labeled_data.loc[group.index[valid], "is_fishing"] = values[indices[valid]]
 
-    labeled_data = data.assign(is_fishing=lambda _: np.nan)
-    labeled_data.update(data_with_labels)
     return labeled_data.sort_values(["mmsi", "timestamp"]).drop(
         columns=["mmsi", "timestamp", "distance_from_shore"]
     )
 
 
 def generate_training_points(data: pd.DataFrame) -> Iterable[dict[str, np.ndarray]]:
-    # Pandas assigns NaN (Not-a-Number) if a value is missing.
-    # If is_fishing equals itself it means it's populated because (NaN != NaN).
-    # For the training data points, we only get points where we have a label.
+    # For the inputs, we grab the past data and the data point itself, so
+    # every training point is a window of `PADDING + 1` time steps.
     padding = trainer.PADDING
-    training_point_indices = (
-        data[padding:].query("is_fishing == is_fishing").index.tolist()
-    )
-    for point_index in training_point_indices:
-        # For the inputs, we grab the past data and the data point itself.
-        inputs = (
-            data.drop(columns=["is_fishing"])
-            .loc[point_index - padding : point_index]
-            .to_dict("list")
-        )
-        # For the outputs, we only grab the label from the data point itself.
-        outputs = (
-            data[["is_fishing"]]
-            .loc[point_index:point_index]
-            .astype("int8")
-            .to_dict("list")
-        )
+    window = padding + 1
+    if len(data) < window:
+        return
+
+    # One contiguous float32 copy of the whole frame; every training point
+    # below is just views into it — a single allocation per DataFrame
+    # instead of one small array per field per point.
+    names = list(data.columns)
+    label_column = names.index("is_fishing")
+    values = np.ascontiguousarray(data.to_numpy(dtype=np.float32))
+    labels = values[:, label_column]
 
-        yield {
-            name: np.reshape(values, (len(values), 1))
-            for name, values in {**inputs, **outputs}.items()
+    # Pandas assigns NaN (Not-a-Number) if a value is missing.
+    # For the training data points, we only get points where we have a label.
+    for offset in np.flatnonzero(~np.isnan(labels[padding:])):
+        window_view = values[offset : offset + window]
+        point = {
+            name: window_view[:, column : column + 1]
+            for column, name in enumerate(names)
+            if column != label_column
         }
+        # For the outputs, we only grab the label from the data point itself.
+        point["is_fishing"] = window_view[
+            padding:, label_column : label_column + 1
+        ].astype(np.int8)
+        yield point
+
+
+def train_eval_partition(
+    serialized_example: bytes, num_partitions: int, percent_train: int
+) -> int:
+    # A content hash makes the split deterministic: the same record always
+    # lands in the same dataset, even when workers retry or records get
+    # reshuffled, and there is no RNG call per element.
+    return 0 if zlib.crc32(serialized_example) % 100 < percent_train else 1
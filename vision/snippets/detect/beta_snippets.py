@@ -33,24 +33,340 @@ https://cloud.google.com/vision/docs.
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import importlib
+import os
+import random
+import sys
+import threading
+import time
+
+from google.api_core import exceptions
+
+# At most this many blocking Vision RPCs run at once per process, so
+# bulk runs stay under per-user rate limits instead of bursting.
+_RPC_SLOTS = threading.BoundedSemaphore(8)
+
+
+def with_retry(max_attempts=3, base=0.5, cap=8.0):
+    """Retries transient Vision errors with jittered exponential backoff.
+
+    A single 429 or brief outage should not abort a bulk run; quota and
+    availability errors are retried with sleeps of base * 2**attempt
+    seconds (capped, plus jitter) before giving up.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    with _RPC_SLOTS:
+                        return fn(*args, **kwargs)
+                except (
+                    exceptions.DeadlineExceeded,
+                    exceptions.ResourceExhausted,
+                    exceptions.ServiceUnavailable,
+                ):
+                    if attempt == max_attempts - 1:
+                        raise
+                    delay = min(cap, base * 2**attempt)
+                    time.sleep(delay + random.uniform(0, delay / 2))
+
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=None)
+def _vision(version):
+    """Imports a Vision GAPIC surface once and caches the module.
+
+    Only the surface the selected subcommand needs is ever imported,
+    and repeat calls skip the import machinery entirely instead of
+    re-executing a from-import per invocation.
+    """
+    return importlib.import_module(f"google.cloud.vision_{version}")
+
+
+@functools.lru_cache(maxsize=None)
+def _feature(version, type_name):
+    """A shared read-only Feature message, built once per surface/type.
+
+    Protobuf message construction is not free (descriptor lookup plus
+    attribute init), and these features never change between calls.
+    """
+    vision = _vision(version)
+    return vision.Feature(type_=vision.Feature.Type[type_name])
+
+
+@functools.lru_cache(maxsize=None)
+def _handwriting_context():
+    """The shared handwriting-OCR ImageContext, built once per process."""
+    # Language hint codes for handwritten OCR:
+    # en-t-i0-handwrit, mul-Latn-t-i0-handwrit
+    # Note: Use only one language hint code per request for handwritten OCR.
+    return _vision("v1p3beta1").ImageContext(language_hints=["en-t-i0-handwrit"])
+
+
+@with_retry()
+def _annotate(method, *args, **kwargs):
+    """Calls a client RPC method under the retry and concurrency policy."""
+    return method(*args, **kwargs)
+
+
+def _write_json(message_cls, response):
+    """Serializes a response to JSON in one C-level pass and writes it.
+
+    For pipelines that want machine-readable output, one MessageToJson
+    call replaces the O(symbols) Python-frame walk of the pretty dump.
+    """
+    sys.stdout.write(
+        message_cls.to_json(response, preserving_proto_field_name=True, indent=None)
+    )
+    sys.stdout.write("\n")
+
+
+def _dump_full_text(full_text_annotation, append):
+    """Walks a full-text annotation and appends one line per node.
+
+    All the OCR snippets share this walk, so the output buffering and
+    repeated-field hoisting live in one place instead of one copy per
+    function.
+    """
+    for page in full_text_annotation.pages:
+        for block in page.blocks:
+            append(f"\nBlock confidence: {block.confidence}\n\n")
+            for paragraph in block.paragraphs:
+                append(f"\tParagraph confidence: {paragraph.confidence}\n")
+                for word in paragraph.words:
+                    # Bind the repeated field once; each word.symbols
+                    # access goes through protobuf descriptor lookup.
+                    syms = word.symbols
+                    word_text = "".join(s.text for s in syms)
+                    append(
+                        f"\t\tWord text: {word_text} "
+                        f"(confidence: {word.confidence})\n"
+                    )
+                    for symbol in syms:
+                        append(
+                            f"\t\t\tSymbol: {symbol.text} "
+                            f"(confidence: {symbol.confidence})\n"
+                        )
+
+
+def _read_bytes(path):
+    """Reads a file into a preallocated buffer, skipping buffered IO.
+
+    open().read() routes every chunk through the buffered IO stack and
+    then copies it into the returned bytes object; reading unbuffered
+    into a presized bytearray avoids that extra pass, which adds up on
+    multi-megabyte images and PDFs.
+    """
+    size = os.path.getsize(path)
+    buf = bytearray(size)
+    view = memoryview(buf)
+    offset = 0
+    with open(path, "rb", buffering=0) as f:
+        while offset < size:
+            read = f.readinto(view[offset:])
+            if not read:
+                break
+            offset += read
+    # protobuf bytes fields accept only real bytes objects.
+    return bytes(view[:offset])
+
+
+def _maybe_downscale(content, max_dim=3072, max_bytes=4_000_000):
+    """Re-encodes oversized images before they go on the wire.
+
+    Vision downsamples internally, so shipping a 20 MB camera JPEG
+    buys nothing but upload time (and risks the per-image size limit).
+    Images over the dimension or byte thresholds are thumbnailed to
+    max_dim and re-encoded as quality-85 JPEG; anything smaller passes
+    through untouched, as do formats Pillow cannot parse.
+    """
+    import io
+
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        image = Image.open(io.BytesIO(content))
+    except UnidentifiedImageError:
+        return content
+
+    if max(image.size) <= max_dim and len(content) <= max_bytes:
+        return content
+
+    image.thumbnail((max_dim, max_dim))
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    buf = io.BytesIO()
+    image.save(buf, "JPEG", quality=85, optimize=True)
+    return buf.getvalue()
+
+
+class VisionCache:
+    """Parquet-backed cache of serialized Vision responses.
+
+    Entries are keyed by the SHA-256 of the input bytes plus the
+    operation type, so replays and development loops over the same
+    images skip the RPC (and its cost) entirely. The table is loaded
+    once per process and rewritten on every put — fine for the
+    snippet-scale workloads this file serves.
+    """
+
+    def __init__(self, path=None):
+        self._path = path or os.path.join(
+            os.path.expanduser("~"), ".cache", "vision", "cache.parquet"
+        )
+        self._entries = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self._path):
+            return
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(self._path)
+        for sha, op, blob in zip(
+            table.column("sha256").to_pylist(),
+            table.column("op_type").to_pylist(),
+            table.column("response_bytes").to_pylist(),
+        ):
+            self._entries[(sha, op)] = blob
+
+    def get(self, sha256, op_type):
+        """Returns the cached serialized response, or None on a miss."""
+        return self._entries.get((sha256, op_type))
+
+    def put(self, sha256, op_type, response_bytes):
+        """Stores a serialized response and persists the table."""
+        self._entries[(sha256, op_type)] = response_bytes
+        self._flush()
+
+    def _flush(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        keys = list(self._entries)
+        table = pa.table(
+            {
+                "sha256": [key[0] for key in keys],
+                "op_type": [key[1] for key in keys],
+                "response_bytes": [self._entries[key] for key in keys],
+            }
+        )
+        pq.write_table(table, self._path)
+
+
+@functools.lru_cache(maxsize=None)
+def _response_cache():
+    """One VisionCache per process, loaded lazily on first use."""
+    return VisionCache()
+
+
+@functools.lru_cache(maxsize=None)
+def _transport_module(version):
+    """The image_annotator transports module for a Vision surface."""
+    return importlib.import_module(
+        f"google.cloud.vision_{version}.services.image_annotator.transports"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_channel():
+    """One authenticated gRPC channel shared by every sync Vision client.
+
+    Both beta surfaces talk to vision.googleapis.com, so a second
+    channel would only buy a redundant TCP+TLS handshake — the
+    dominant cost on cold starts.
+    """
+    return _transport_module("v1p3beta1").ImageAnnotatorGrpcTransport.create_channel()
+
+
+@functools.lru_cache(maxsize=None)
+def _client_v1p3():
+    """One ImageAnnotatorClient per process for the v1p3beta1 surface.
+
+    Client construction does credential discovery and a gRPC channel
+    setup — hundreds of milliseconds that scripts calling several
+    snippets should only pay once.
+    """
+    vision = _vision("v1p3beta1")
+
+    transport = _transport_module("v1p3beta1").ImageAnnotatorGrpcTransport(
+        channel=_shared_channel()
+    )
+    return vision.ImageAnnotatorClient(transport=transport)
+
+
+@functools.lru_cache(maxsize=None)
+def _async_client_v1p3():
+    """One ImageAnnotatorAsyncClient per process (gRPC asyncio transport)."""
+    vision = _vision("v1p3beta1")
+
+    return vision.ImageAnnotatorAsyncClient()
+
+
+@functools.lru_cache(maxsize=None)
+def _client_v1p4():
+    """One ImageAnnotatorClient per process for the v1p4beta1 surface.
+
+    Rides the same gRPC channel as the v1p3beta1 client.
+    """
+    vision = _vision("v1p4beta1")
+
+    transport = _transport_module("v1p4beta1").ImageAnnotatorGrpcTransport(
+        channel=_shared_channel()
+    )
+    return vision.ImageAnnotatorClient(transport=transport)
+
+
+@functools.lru_cache(maxsize=None)
+def _async_client_v1p4():
+    """One ImageAnnotatorAsyncClient per process for the v1p4beta1 surface."""
+    vision = _vision("v1p4beta1")
+
+    return vision.ImageAnnotatorAsyncClient()
 
 
 # [START vision_localize_objects_beta]
 def localize_objects(path):
     """Localize objects in the local image.
 
+    Inline bytes give the lowest latency for a one-shot realtime call;
+    if the image already lives in Cloud Storage and will be annotated
+    again, prefer localize_objects_uri to skip re-uploading it.
+
     Args:
     path: The path to the local file.
     """
-    from google.cloud import vision_v1p3beta1 as vision
-
-    client = vision.ImageAnnotatorClient()
+    vision = _vision("v1p3beta1")
 
-    with open(path, "rb") as image_file:
-        content = image_file.read()
-    image = vision.Image(content=content)
-
-    objects = client.object_localization(image=image).localized_object_annotations
+    content = _maybe_downscale(_read_bytes(path))
+    digest = hashlib.sha256(content).hexdigest()
+    cached = _response_cache().get(digest, "object_localization")
+    if cached is not None:
+        response = vision.AnnotateImageResponse.deserialize(cached)
+    else:
+        # The client is cached per process and reused across calls.
+        client = _client_v1p3()
+        image = vision.Image(content=content)
+        response = _annotate(client.object_localization, image=image)
+        # Never persist an error response: a cached failure would replay
+        # on every future call for this image.
+        if not response.error.message:
+            _response_cache().put(
+                digest,
+                "object_localization",
+                vision.AnnotateImageResponse.serialize(response),
+            )
+
+    objects = response.localized_object_annotations
 
     print(f"Number of objects found: {len(objects)}")
     for object_ in objects:
@@ -70,14 +386,17 @@ def localize_objects_uri(uri):
     Args:
     uri: The path to the file in Google Cloud Storage (gs://...)
     """
-    from google.cloud import vision_v1p3beta1 as vision
+    vision = _vision("v1p3beta1")
 
-    client = vision.ImageAnnotatorClient()
+    # The client is cached per process and reused across calls.
+    client = _client_v1p3()
 
     image = vision.Image()
     image.source.image_uri = uri
 
-    objects = client.object_localization(image=image).localized_object_annotations
+    objects = _annotate(
+        client.object_localization, image=image
+    ).localized_object_annotations
 
     print(f"Number of objects found: {len(objects)}")
     for object_ in objects:
@@ -90,51 +409,176 @@ def localize_objects_uri(uri):
 # [END vision_localize_objects_gcs_beta]
 
 
-# [START vision_handwritten_ocr_beta]
-def detect_handwritten_ocr(path):
-    """Detects handwritten characters in a local image.
+# Vision accepts at most 16 images per batch_annotate_images request.
+_BATCH_LIMIT = 16
+
+
+def localize_objects_batch(paths):
+    """Localize objects in several local images.
+
+    The network round trip dominates annotation time for small images,
+    so up to 16 images are packed into each batch_annotate_images call
+    instead of paying one RPC per image.
+
+    Args:
+    paths: The paths to the local files.
+    """
+    vision = _vision("v1p3beta1")
+
+    client = _client_v1p3()
+    feature = _feature("v1p3beta1", "OBJECT_LOCALIZATION")
+
+    requests = []
+    for path in paths:
+        content = _read_bytes(path)
+        requests.append(
+            vision.AnnotateImageRequest(
+                image=vision.Image(content=content), features=[feature]
+            )
+        )
+
+    for start in range(0, len(requests), _BATCH_LIMIT):
+        response = _annotate(
+            client.batch_annotate_images,
+            requests=requests[start : start + _BATCH_LIMIT],
+        )
+        # Responses come back in request order.
+        for path, image_response in zip(paths[start:], response.responses):
+            objects = image_response.localized_object_annotations
+            print(f"\n{path}: {len(objects)} objects found")
+            for object_ in objects:
+                print(f"{object_.name} (confidence: {object_.score})")
+
+
+async def localize_objects_async(path):
+    """Localize objects in a local image without blocking the event loop.
 
     Args:
     path: The path to the local file.
     """
-    from google.cloud import vision_v1p3beta1 as vision
+    vision = _vision("v1p3beta1")
 
-    client = vision.ImageAnnotatorClient()
+    # The async client shares one gRPC asyncio channel across all
+    # in-flight calls, so concurrent requests multiplex instead of
+    # queueing behind each other.
+    client = _async_client_v1p3()
 
-    with open(path, "rb") as image_file:
-        content = image_file.read()
+    content = _read_bytes(path)
 
-    image = vision.Image(content=content)
+    request = vision.AnnotateImageRequest(
+        image=vision.Image(content=content),
+        features=[_feature("v1p3beta1", "OBJECT_LOCALIZATION")],
+    )
+    response = await client.batch_annotate_images(requests=[request])
 
-    # Language hint codes for handwritten OCR:
-    # en-t-i0-handwrit, mul-Latn-t-i0-handwrit
-    # Note: Use only one language hint code per request for handwritten OCR.
-    image_context = vision.ImageContext(language_hints=["en-t-i0-handwrit"])
+    objects = response.responses[0].localized_object_annotations
+    print(f"\n{path}: {len(objects)} objects found")
+    for object_ in objects:
+        print(f"{object_.name} (confidence: {object_.score})")
 
-    response = client.document_text_detection(image=image, image_context=image_context)
 
-    print(f"Full Text: {response.full_text_annotation.text}")
-    for page in response.full_text_annotation.pages:
-        for block in page.blocks:
-            print(f"\nBlock confidence: {block.confidence}\n")
+async def run_many(paths, fn, concurrency=8):
+    """Runs ``await fn(path)`` for every path, at most `concurrency` at once.
 
-            for paragraph in block.paragraphs:
-                print("Paragraph confidence: {}".format(paragraph.confidence))
+    The semaphore keeps the number of in-flight RPCs bounded so large
+    path lists do not trip per-user rate limits.
 
-                for word in paragraph.words:
-                    word_text = "".join([symbol.text for symbol in word.symbols])
-                    print(
-                        "Word text: {} (confidence: {})".format(
-                            word_text, word.confidence
-                        )
-                    )
+    Args:
+    paths: The paths to pass to fn, one call each.
+    fn: An async callable taking a single path.
+    concurrency: Maximum number of calls in flight at once.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(path):
+        async with semaphore:
+            return await fn(path)
+
+    return await asyncio.gather(*(bounded(path) for path in paths))
+
+
+def detect_handwritten_ocr_batch(paths):
+    """Detects handwritten characters in several local images.
+
+    Like localize_objects_batch, packs up to 16 images into each
+    batch_annotate_images call.
+
+    Args:
+    paths: The paths to the local files.
+    """
+    vision = _vision("v1p3beta1")
+
+    client = _client_v1p3()
+    feature = _feature("v1p3beta1", "DOCUMENT_TEXT_DETECTION")
+    image_context = _handwriting_context()
+
+    requests = []
+    for path in paths:
+        content = _read_bytes(path)
+        requests.append(
+            vision.AnnotateImageRequest(
+                image=vision.Image(content=content),
+                features=[feature],
+                image_context=image_context,
+            )
+        )
+
+    for start in range(0, len(requests), _BATCH_LIMIT):
+        response = _annotate(
+            client.batch_annotate_images,
+            requests=requests[start : start + _BATCH_LIMIT],
+        )
+        for path, image_response in zip(paths[start:], response.responses):
+            if image_response.error.message:
+                print(f"\n{path}: {image_response.error.message}")
+                continue
+            print(f"\n{path} full text: {image_response.full_text_annotation.text}")
 
-                    for symbol in word.symbols:
-                        print(
-                            "\tSymbol: {} (confidence: {})".format(
-                                symbol.text, symbol.confidence
-                            )
-                        )
+
+# [START vision_handwritten_ocr_beta]
+def detect_handwritten_ocr(path):
+    """Detects handwritten characters in a local image.
+
+    Inline bytes give the lowest latency for a one-shot realtime call;
+    if the image already lives in Cloud Storage and will be annotated
+    again, prefer detect_handwritten_ocr_uri to skip re-uploading it.
+
+    Args:
+    path: The path to the local file.
+    """
+    vision = _vision("v1p3beta1")
+
+    content = _maybe_downscale(_read_bytes(path))
+    digest = hashlib.sha256(content).hexdigest()
+    cached = _response_cache().get(digest, "document_text_detection")
+    if cached is not None:
+        response = vision.AnnotateImageResponse.deserialize(cached)
+    else:
+        # The client is cached per process and reused across calls.
+        client = _client_v1p3()
+
+        image = vision.Image(content=content)
+
+        image_context = _handwriting_context()
+
+        response = _annotate(
+            client.document_text_detection, image=image, image_context=image_context
+        )
+        # Never persist an error response: a cached failure would replay
+        # on every future call for this image.
+        if not response.error.message:
+            _response_cache().put(
+                digest,
+                "document_text_detection",
+                vision.AnnotateImageResponse.serialize(response),
+            )
+
+    # Buffer the report and emit it in one write: a per-symbol print
+    # would mean thousands of formatted, flushed lines for a full page.
+    out = []
+    out.append(f"Full Text: {response.full_text_annotation.text}\n")
+    _dump_full_text(response.full_text_annotation, out.append)
+    sys.stdout.write("".join(out))
 
     if response.error.message:
         raise Exception(
@@ -154,41 +598,25 @@ def detect_handwritten_ocr_uri(uri):
     Args:
     uri: The path to the file in Google Cloud Storage (gs://...)
     """
-    from google.cloud import vision_v1p3beta1 as vision
+    vision = _vision("v1p3beta1")
 
-    client = vision.ImageAnnotatorClient()
+    # The client is cached per process and reused across calls.
+    client = _client_v1p3()
     image = vision.Image()
     image.source.image_uri = uri
 
-    # Language hint codes for handwritten OCR:
-    # en-t-i0-handwrit, mul-Latn-t-i0-handwrit
-    # Note: Use only one language hint code per request for handwritten OCR.
-    image_context = vision.ImageContext(language_hints=["en-t-i0-handwrit"])
-
-    response = client.document_text_detection(image=image, image_context=image_context)
-
-    print(f"Full Text: {response.full_text_annotation.text}")
-    for page in response.full_text_annotation.pages:
-        for block in page.blocks:
-            print(f"\nBlock confidence: {block.confidence}\n")
+    image_context = _handwriting_context()
 
-            for paragraph in block.paragraphs:
-                print("Paragraph confidence: {}".format(paragraph.confidence))
-
-                for word in paragraph.words:
-                    word_text = "".join([symbol.text for symbol in word.symbols])
-                    print(
-                        "Word text: {} (confidence: {})".format(
-                            word_text, word.confidence
-                        )
-                    )
+    response = _annotate(
+        client.document_text_detection, image=image, image_context=image_context
+    )
 
-                    for symbol in word.symbols:
-                        print(
-                            "\tSymbol: {} (confidence: {})".format(
-                                symbol.text, symbol.confidence
-                            )
-                        )
+    # Buffer the report and emit it in one write: a per-symbol print
+    # would mean thousands of formatted, flushed lines for a full page.
+    out = []
+    out.append(f"Full Text: {response.full_text_annotation.text}\n")
+    _dump_full_text(response.full_text_annotation, out.append)
+    sys.stdout.write("".join(out))
 
     if response.error.message:
         raise Exception(
@@ -201,7 +629,7 @@ def detect_handwritten_ocr_uri(uri):
 
 
 # [START vision_batch_annotate_files_beta]
-def detect_batch_annotate_files(path):
+def detect_batch_annotate_files(path, as_json=False):
     """Detects document features in a PDF/TIFF/GIF file.
 
     While your PDF file may have several pages,
@@ -209,56 +637,120 @@ def detect_batch_annotate_files(path):
 
     Args:
     path: The path to the local file.
+    as_json: Emit the raw response as JSON instead of the nested walk.
     """
-    from google.cloud import vision_v1p4beta1 as vision
-
-    client = vision.ImageAnnotatorClient()
+    vision = _vision("v1p4beta1")
 
-    with open(path, "rb") as pdf_file:
-        content = pdf_file.read()
-
-    # Other supported mime_types: image/tiff' or 'image/gif'
-    mime_type = "application/pdf"
-    input_config = vision.InputConfig(content=content, mime_type=mime_type)
+    content = _read_bytes(path)
+    digest = hashlib.sha256(content).hexdigest()
+    cached = _response_cache().get(digest, "batch_annotate_files")
+    if cached is not None:
+        response = vision.BatchAnnotateFilesResponse.deserialize(cached)
+    else:
+        # The client is cached per process and reused across calls.
+        client = _client_v1p4()
 
-    feature = vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)
-    # Annotate the first two pages and the last one (max 5 pages)
-    # First page starts at 1, and not 0. Last page is -1.
-    pages = [1, 2, -1]
+        # Other supported mime_types: image/tiff' or 'image/gif'
+        mime_type = "application/pdf"
+        input_config = vision.InputConfig(content=content, mime_type=mime_type)
 
-    request = vision.AnnotateFileRequest(
-        input_config=input_config, features=[feature], pages=pages
-    )
+        feature = _feature("v1p4beta1", "DOCUMENT_TEXT_DETECTION")
+        # Annotate the first two pages and the last one (max 5 pages)
+        # First page starts at 1, and not 0. Last page is -1.
+        pages = [1, 2, -1]
 
-    response = client.batch_annotate_files(requests=[request])
+        request = vision.AnnotateFileRequest(
+            input_config=input_config, features=[feature], pages=pages
+        )
 
+        response = _annotate(client.batch_annotate_files, requests=[request])
+        # Never persist an error response: a cached failure would replay
+        # on every future call for this file.
+        if not any(
+            image_response.error.message
+            for file_response in response.responses
+            for image_response in file_response.responses
+        ):
+            _response_cache().put(
+                digest,
+                "batch_annotate_files",
+                vision.BatchAnnotateFilesResponse.serialize(response),
+            )
+
+    if as_json:
+        _write_json(vision.BatchAnnotateFilesResponse, response)
+        return
+
+    # Buffer the report and emit it in one write: a per-symbol print
+    # would mean thousands of formatted, flushed lines per PDF page.
+    out = []
     for image_response in response.responses[0].responses:
-        for page in image_response.full_text_annotation.pages:
-            for block in page.blocks:
-                print(f"\nBlock confidence: {block.confidence}\n")
-                for par in block.paragraphs:
-                    print(f"\tParagraph confidence: {par.confidence}")
-                    for word in par.words:
-                        symbol_texts = [symbol.text for symbol in word.symbols]
-                        word_text = "".join(symbol_texts)
-                        print(
-                            "\t\tWord text: {} (confidence: {})".format(
-                                word_text, word.confidence
-                            )
-                        )
-                        for symbol in word.symbols:
-                            print(
-                                "\t\t\tSymbol: {} (confidence: {})".format(
-                                    symbol.text, symbol.confidence
-                                )
-                            )
+        _dump_full_text(image_response.full_text_annotation, out.append)
+    sys.stdout.write("".join(out))
 
 
 # [END vision_batch_annotate_files_beta]
 
 
+def detect_batch_annotate_files_many(paths, max_workers=8):
+    """Annotates several PDFs concurrently from a thread pool.
+
+    The work is pure network wait and gRPC's C core releases the GIL
+    during the blocking call, so threads give near-linear speedup
+    without an asyncio rewrite. Each worker still goes through
+    _annotate, so the retry policy and the global RPC semaphore keep
+    the fan-out polite.
+
+    Args:
+    paths: The paths to the local files.
+    max_workers: How many annotation threads to run at once.
+    """
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(detect_batch_annotate_files, paths))
+
+
+async def detect_batch_annotate_files_parallel(path, pages=(1, 2, -1)):
+    """Annotates each requested PDF page in its own parallel request.
+
+    A single batch_annotate_files call works through its page list
+    serially on the server; fanning out one single-page request per
+    page under asyncio.gather cuts wall time to the slowest page for
+    the same per-page cost.
+
+    Args:
+    path: The path to the local file.
+    pages: The page numbers to annotate (first page is 1, last is -1).
+    """
+    vision = _vision("v1p4beta1")
+
+    client = _async_client_v1p4()
+
+    content = _read_bytes(path)
+    input_config = vision.InputConfig(content=content, mime_type="application/pdf")
+    feature = _feature("v1p4beta1", "DOCUMENT_TEXT_DETECTION")
+
+    async def annotate_page(page):
+        request = vision.AnnotateFileRequest(
+            input_config=input_config, features=[feature], pages=[page]
+        )
+        response = await client.batch_annotate_files(requests=[request])
+        return response.responses[0]
+
+    # Results come back in the order the pages were requested.
+    file_responses = await asyncio.gather(*(annotate_page(page) for page in pages))
+
+    out = []
+    append = out.append
+    for file_response in file_responses:
+        for image_response in file_response.responses:
+            append(f"Full text: {image_response.full_text_annotation.text}\n")
+    sys.stdout.write("".join(out))
+
+
 # [START vision_batch_annotate_files_gcs_beta]
-def detect_batch_annotate_files_uri(gcs_uri):
+def detect_batch_annotate_files_uri(gcs_uri, as_json=False):
     """Detects document features in a PDF/TIFF/GIF file.
 
     While your PDF file may have several pages,
@@ -266,10 +758,12 @@ def detect_batch_annotate_files_uri(gcs_uri):
 
     Args:
     uri: The path to the file in Google Cloud Storage (gs://...)
+    as_json: Emit the raw response as JSON instead of the nested walk.
     """
-    from google.cloud import vision_v1p4beta1 as vision
+    vision = _vision("v1p4beta1")
 
-    client = vision.ImageAnnotatorClient()
+    # The client is cached per process and reused across calls.
+    client = _client_v1p4()
 
     # Other supported mime_types: image/tiff' or 'image/gif'
     mime_type = "application/pdf"
@@ -277,7 +771,7 @@ def detect_batch_annotate_files_uri(gcs_uri):
         gcs_source=vision.GcsSource(uri=gcs_uri), mime_type=mime_type
     )
 
-    feature = vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)
+    feature = _feature("v1p4beta1", "DOCUMENT_TEXT_DETECTION")
     # Annotate the first two pages and the last one (max 5 pages)
     # First page starts at 1, and not 0. Last page is -1.
     pages = [1, 2, -1]
@@ -286,33 +780,109 @@ def detect_batch_annotate_files_uri(gcs_uri):
         input_config=input_config, features=[feature], pages=pages
     )
 
-    response = client.batch_annotate_files(requests=[request])
+    response = _annotate(client.batch_annotate_files, requests=[request])
 
+    if as_json:
+        _write_json(vision.BatchAnnotateFilesResponse, response)
+        return
+
+    # Buffer the report and emit it in one write: a per-symbol print
+    # would mean thousands of formatted, flushed lines per PDF page.
+    out = []
     for image_response in response.responses[0].responses:
-        for page in image_response.full_text_annotation.pages:
-            for block in page.blocks:
-                print(f"\nBlock confidence: {block.confidence}\n")
-                for par in block.paragraphs:
-                    print(f"\tParagraph confidence: {par.confidence}")
-                    for word in par.words:
-                        symbol_texts = [symbol.text for symbol in word.symbols]
-                        word_text = "".join(symbol_texts)
-                        print(
-                            "\t\tWord text: {} (confidence: {})".format(
-                                word_text, word.confidence
-                            )
-                        )
-                        for symbol in word.symbols:
-                            print(
-                                "\t\t\tSymbol: {} (confidence: {})".format(
-                                    symbol.text, symbol.confidence
-                                )
-                            )
+        _dump_full_text(image_response.full_text_annotation, out.append)
+    sys.stdout.write("".join(out))
 
 
 # [END vision_batch_annotate_files_gcs_beta]
 
 
+def detect_document_features_uri_async(gcs_uri, output_uri, batch_size=20):
+    """Starts asynchronous document feature detection for a GCS file.
+
+    Unlike batch_annotate_files, which blocks the caller for the whole
+    OCR run and handles at most 5 pages, async_batch_annotate_files
+    returns a long-running operation in milliseconds and writes the
+    results to Google Cloud Storage. Pair with wait_and_read to collect
+    the output, or hand the operation off and return immediately.
+
+    Args:
+    gcs_uri: The path to the PDF file in Google Cloud Storage (gs://...)
+    output_uri: The GCS prefix to write JSON results under (gs://...)
+    batch_size: How many pages to group into each output JSON shard.
+
+    Returns:
+    The long-running Operation, not yet awaited.
+    """
+    vision = _vision("v1p4beta1")
+
+    # The async surface only reads from and writes to Cloud Storage;
+    # inline bytes are a sync-only option.
+    for uri in (gcs_uri, output_uri):
+        if not uri.startswith("gs://"):
+            raise ValueError(
+                f"{uri!r} is not a gs:// URI. async_batch_annotate_files only "
+                "works against Cloud Storage; upload local files with "
+                "google.cloud.storage first."
+            )
+
+    # The client is cached per process and reused across calls.
+    client = _client_v1p4()
+
+    input_config = vision.InputConfig(
+        gcs_source=vision.GcsSource(uri=gcs_uri), mime_type="application/pdf"
+    )
+    feature = _feature("v1p4beta1", "DOCUMENT_TEXT_DETECTION")
+    output_config = vision.OutputConfig(
+        gcs_destination=vision.GcsDestination(uri=output_uri), batch_size=batch_size
+    )
+
+    request = vision.AsyncAnnotateFileRequest(
+        input_config=input_config, features=[feature], output_config=output_config
+    )
+
+    return client.async_batch_annotate_files(requests=[request])
+
+
+def wait_and_read(operation, output_uri):
+    """Waits for an async annotation operation and prints its GCS output.
+
+    Args:
+    operation: The Operation returned by detect_document_features_uri_async.
+    output_uri: The GCS prefix the results were written under (gs://...)
+    """
+    import re
+
+    from google.cloud import storage
+
+    vision = _vision("v1p4beta1")
+
+    print("Waiting for the operation to finish.")
+    operation.result(timeout=420)
+
+    storage_client = storage.Client()
+
+    match = re.match(r"gs://([^/]+)/(.+)", output_uri)
+    bucket_name = match.group(1)
+    prefix = match.group(2)
+
+    bucket = storage_client.get_bucket(bucket_name)
+
+    # Each output shard holds up to batch_size pages of responses.
+    blob_list = list(bucket.list_blobs(prefix=prefix))
+    print("Output files:")
+    for blob in blob_list:
+        print(blob.name)
+
+    for blob in blob_list:
+        json_string = blob.download_as_bytes().decode("utf-8")
+        response = vision.AnnotateFileResponse.from_json(
+            json_string, ignore_unknown_fields=True
+        )
+        for image_response in response.responses:
+            print(image_response.full_text_annotation.text)
+
+
 # [START vision_async_batch_annotate_images_beta]
 def async_batch_annotate_images_uri(input_image_uri, output_uri):
     """Batch annotation of images on Google Cloud Storage asynchronously.
@@ -323,11 +893,22 @@ def async_batch_annotate_images_uri(input_image_uri, output_uri):
     """
     import re
 
+    # The async surface only reads from and writes to Cloud Storage;
+    # inline bytes are a sync-only option.
+    for uri in (input_image_uri, output_uri):
+        if not uri.startswith("gs://"):
+            raise ValueError(
+                f"{uri!r} is not a gs:// URI. async_batch_annotate_images only "
+                "works against Cloud Storage; upload local files with "
+                "google.cloud.storage first."
+            )
+
     from google.cloud import storage
 
-    from google.cloud import vision_v1p4beta1 as vision
+    vision = _vision("v1p4beta1")
 
-    client = vision.ImageAnnotatorClient()
+    # The client is cached per process and reused across calls.
+    client = _client_v1p4()
 
     # Construct the request for the image(s) to be annotated:
     image_source = vision.ImageSource(image_uri=input_image_uri)
@@ -386,6 +967,70 @@ def async_batch_annotate_images_uri(input_image_uri, output_uri):
 # [END vision_async_batch_annotate_images_beta]
 
 
+def enqueue_vision_jobs(paths, feature_type, stream="vision:jobs"):
+    """Pushes one annotation job per path onto a Redis stream.
+
+    Decouples the producer from the Vision workers: the driver can exit
+    once the jobs are queued, and any number of run_worker processes
+    drain the stream. Each job carries the SHA-256 of the file bytes as
+    an idempotency key, so redelivered jobs dedup against the response
+    cache instead of spending API budget twice.
+
+    Args:
+    paths: The paths to the local files to annotate.
+    feature_type: A key of _JOB_HANDLERS naming the annotation to run.
+    stream: The Redis stream to enqueue onto.
+    """
+    import redis
+
+    conn = redis.Redis()
+    for path in paths:
+        digest = hashlib.sha256(_read_bytes(path)).hexdigest()
+        conn.xadd(
+            stream, {"path": path, "feature": feature_type, "idem": digest}
+        )
+    print(f"Enqueued {len(paths)} jobs on {stream}")
+
+
+_JOB_HANDLERS = {
+    "object_localization": localize_objects,
+    "document_text_detection": detect_handwritten_ocr,
+}
+
+
+def run_worker(stream="vision:jobs", group="vision-workers", consumer="worker-1"):
+    """Consumes annotation jobs from a Redis stream until it drains.
+
+    Stateless and crash-safe: jobs are acked only after the handler
+    finishes, so anything in flight when a worker dies is redelivered,
+    and the content-hash response cache makes the retry cost nothing.
+    Start several workers (with distinct consumer names) to scale out.
+
+    Args:
+    stream: The Redis stream to consume from.
+    group: The consumer group name.
+    consumer: This worker's name within the group.
+    """
+    import redis
+
+    conn = redis.Redis()
+    try:
+        conn.xgroup_create(stream, group, id="0", mkstream=True)
+    except redis.ResponseError:
+        # The group already exists; join it.
+        pass
+
+    while True:
+        entries = conn.xreadgroup(group, consumer, {stream: ">"}, count=1, block=5000)
+        if not entries:
+            break
+        for _, messages in entries:
+            for message_id, fields in messages:
+                handler = _JOB_HANDLERS[fields[b"feature"].decode()]
+                handler(fields[b"path"].decode())
+                conn.xack(stream, group, message_id)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
@@ -396,53 +1041,128 @@ if __name__ == "__main__":
         "object-localization", help=localize_objects.__doc__
     )
     object_parser.add_argument("path")
+    object_parser.set_defaults(func=lambda args: localize_objects(args.path))
 
     object_uri_parser = subparsers.add_parser(
         "object-localization-uri", help=localize_objects_uri.__doc__
     )
     object_uri_parser.add_argument("uri")
+    object_uri_parser.set_defaults(func=lambda args: localize_objects_uri(args.uri))
+
+    object_batch_parser = subparsers.add_parser(
+        "object-localization-batch", help=localize_objects_batch.__doc__
+    )
+    object_batch_parser.add_argument("paths", nargs="+")
+    object_batch_parser.set_defaults(func=lambda args: localize_objects_batch(args.paths))
+
+    object_many_parser = subparsers.add_parser(
+        "object-localization-many", help=localize_objects_async.__doc__
+    )
+    object_many_parser.add_argument("paths", nargs="+")
+    object_many_parser.set_defaults(
+        func=lambda args: asyncio.run(run_many(args.paths, localize_objects_async))
+    )
+
+    handwritten_batch_parser = subparsers.add_parser(
+        "handwritten-ocr-batch", help=detect_handwritten_ocr_batch.__doc__
+    )
+    handwritten_batch_parser.add_argument("paths", nargs="+")
+    handwritten_batch_parser.set_defaults(
+        func=lambda args: detect_handwritten_ocr_batch(args.paths)
+    )
 
     handwritten_parser = subparsers.add_parser(
         "handwritten-ocr", help=detect_handwritten_ocr.__doc__
     )
     handwritten_parser.add_argument("path")
+    handwritten_parser.set_defaults(func=lambda args: detect_handwritten_ocr(args.path))
 
     handwritten_uri_parser = subparsers.add_parser(
         "handwritten-ocr-uri", help=detect_handwritten_ocr_uri.__doc__
     )
     handwritten_uri_parser.add_argument("uri")
+    handwritten_uri_parser.set_defaults(
+        func=lambda args: detect_handwritten_ocr_uri(args.uri)
+    )
 
     batch_annotate_parser = subparsers.add_parser(
         "batch-annotate-files", help=detect_batch_annotate_files.__doc__
     )
     batch_annotate_parser.add_argument("path")
+    batch_annotate_parser.add_argument("--json", action="store_true")
+    batch_annotate_parser.set_defaults(
+        func=lambda args: detect_batch_annotate_files(args.path, as_json=args.json)
+    )
+
+    batch_annotate_many_parser = subparsers.add_parser(
+        "batch-annotate-files-many", help=detect_batch_annotate_files_many.__doc__
+    )
+    batch_annotate_many_parser.add_argument("paths", nargs="+")
+    batch_annotate_many_parser.set_defaults(
+        func=lambda args: detect_batch_annotate_files_many(args.paths)
+    )
+
+    batch_annotate_parallel_parser = subparsers.add_parser(
+        "batch-annotate-files-parallel",
+        help=detect_batch_annotate_files_parallel.__doc__,
+    )
+    batch_annotate_parallel_parser.add_argument("path")
+    batch_annotate_parallel_parser.set_defaults(
+        func=lambda args: asyncio.run(detect_batch_annotate_files_parallel(args.path))
+    )
 
     batch_annotate_uri_parser = subparsers.add_parser(
         "batch-annotate-files-uri", help=detect_batch_annotate_files_uri.__doc__
     )
     batch_annotate_uri_parser.add_argument("uri")
+    batch_annotate_uri_parser.add_argument("--json", action="store_true")
+    batch_annotate_uri_parser.set_defaults(
+        func=lambda args: detect_batch_annotate_files_uri(args.uri, as_json=args.json)
+    )
+
+    document_async_parser = subparsers.add_parser(
+        "document-features-uri-async", help=detect_document_features_uri_async.__doc__
+    )
+    document_async_parser.add_argument("uri")
+    document_async_parser.add_argument("output")
+    document_async_parser.set_defaults(
+        func=lambda args: wait_and_read(
+            detect_document_features_uri_async(args.uri, args.output), args.output
+        )
+    )
 
     batch_annotate__image_uri_parser = subparsers.add_parser(
         "batch-annotate-images-uri", help=async_batch_annotate_images_uri.__doc__
     )
     batch_annotate__image_uri_parser.add_argument("uri")
     batch_annotate__image_uri_parser.add_argument("output")
+    batch_annotate__image_uri_parser.set_defaults(
+        func=lambda args: async_batch_annotate_images_uri(args.uri, args.output)
+    )
+
+    enqueue_parser = subparsers.add_parser(
+        "enqueue-jobs", help=enqueue_vision_jobs.__doc__
+    )
+    enqueue_parser.add_argument("paths", nargs="+")
+    enqueue_parser.add_argument(
+        "--feature",
+        choices=sorted(_JOB_HANDLERS),
+        default="object_localization",
+    )
+    enqueue_parser.set_defaults(
+        func=lambda args: enqueue_vision_jobs(args.paths, args.feature)
+    )
+
+    worker_parser = subparsers.add_parser("run-worker", help=run_worker.__doc__)
+    worker_parser.add_argument("--consumer", default="worker-1")
+    worker_parser.set_defaults(func=lambda args: run_worker(consumer=args.consumer))
 
     args = parser.parse_args()
 
-    if "uri" in args.command:
-        if "object-localization-uri" in args.command:
-            localize_objects_uri(args.uri)
-        elif "handwritten-ocr-uri" in args.command:
-            detect_handwritten_ocr_uri(args.uri)
-        elif "batch-annotate-files-uri" in args.command:
-            detect_batch_annotate_files_uri(args.uri)
-        elif "batch-annotate-images-uri" in args.command:
-            async_batch_annotate_images_uri(args.uri, args.output)
+    # Each subparser binds its handler via set_defaults(func=...), so
+    # dispatch is one attribute access and the right function always
+    # runs; missing subcommands print usage instead of crashing.
+    if hasattr(args, "func"):
+        args.func(args)
     else:
-        if "object-localization" in args.command:
-            localize_objects(args.path)
-        elif "handwritten-ocr" in args.command:
-            detect_handwritten_ocr(args.path)
-        elif "batch-annotate-files" in args.command:
-            detect_batch_annotate_files(args.path)
+        parser.print_usage()
@@ -15,12 +15,21 @@
 # [START vision_batch_annotate_files]
 
 
+import functools
+import sys
+
 from google.cloud import vision_v1
 
 
+@functools.lru_cache(maxsize=None)
+def _get_client():
+    """One ImageAnnotatorClient per process, shared across calls."""
+    return vision_v1.ImageAnnotatorClient()
+
+
 def sample_batch_annotate_files(file_path="path/to/your/document.pdf"):
     """Perform batch file annotation."""
-    client = vision_v1.ImageAnnotatorClient()
+    client = _get_client()
 
     # Supported mime_type: application/pdf, image/tiff, image/gif
     mime_type = "application/pdf"
@@ -35,21 +44,25 @@ def sample_batch_annotate_files(file_path="path/to/your/document.pdf"):
     requests = [{"input_config": input_config, "features": features, "pages": pages}]
 
     response = client.batch_annotate_files(requests=requests)
+    # Buffer the report and emit it in one write: a per-symbol print
+    # would mean thousands of formatted, flushed lines per PDF page.
+    out = []
+    append = out.append
     for image_response in response.responses[0].responses:
-        print(f"Full text: {image_response.full_text_annotation.text}")
+        append(f"Full text: {image_response.full_text_annotation.text}\n")
         for page in image_response.full_text_annotation.pages:
             for block in page.blocks:
-                print(f"\nBlock confidence: {block.confidence}")
+                append(f"\nBlock confidence: {block.confidence}\n")
                 for par in block.paragraphs:
-                    print(f"\tParagraph confidence: {par.confidence}")
+                    append(f"\tParagraph confidence: {par.confidence}\n")
                     for word in par.words:
-                        print(f"\t\tWord confidence: {word.confidence}")
+                        append(f"\t\tWord confidence: {word.confidence}\n")
                         for symbol in word.symbols:
-                            print(
-                                "\t\t\tSymbol: {}, (confidence: {})".format(
-                                    symbol.text, symbol.confidence
-                                )
+                            append(
+                                f"\t\t\tSymbol: {symbol.text}, "
+                                f"(confidence: {symbol.confidence})\n"
                             )
+    sys.stdout.write("".join(out))
 
 
 # [END vision_batch_annotate_files]
@@ -13,10 +13,18 @@
 # limitations under the License.
 
 # [START vmwareengine_cancel_cloud_deletion]
+import functools
+
 from google.api_core import operation
 from google.cloud import vmwareengine_v1
 
 
+@functools.lru_cache(maxsize=None)
+def _get_client() -> vmwareengine_v1.VmwareEngineClient:
+    """One VmwareEngineClient per process, shared across calls."""
+    return vmwareengine_v1.VmwareEngineClient()
+
+
 def cancel_private_cloud_deletion_by_full_name(cloud_name: str) -> operation.Operation:
     """
     Cancels in progress deletion of VMWare Private Cloud.
@@ -29,9 +37,8 @@ def cancel_private_cloud_deletion_by_full_name(cloud_name: str) -> operation.Ope
     Returns:
         An Operation object related to canceling private cloud deletion operation.
     """
-    client = vmwareengine_v1.VmwareEngineClient()
-    request = vmwareengine_v1.UndeletePrivateCloudRequest()
-    request.name = cloud_name
+    client = _get_client()
+    request = vmwareengine_v1.UndeletePrivateCloudRequest(name=cloud_name)
     return client.undelete_private_cloud(request)
 
 
@@ -49,8 +56,12 @@ def cancel_private_cloud_deletion(
     Returns:
         An Operation object related to canceling private cloud deletion operation.
     """
+    # The generated path helper renders the resource name from its
+    # template, so the format can't drift from what the API expects.
     return cancel_private_cloud_deletion_by_full_name(
-        f"projects/{project_id}/locations/{zone}/privateClouds/{cloud_name}"
+        vmwareengine_v1.VmwareEngineClient.private_cloud_path(
+            project_id, zone, cloud_name
+        )
     )
 
 